@@ -110,7 +110,7 @@ def main():
         print("🔍 Dry run mode - showing what would be generated:")
         print("   📓 Notebooks: perfect_student.ipynb, missing_tasks_student.ipynb, ...")
         print("   📋 Rubrics: standard_rubric.csv, invalid_rubric.csv, ...")
-        print("   🔌 API Mocks: perfect_responses.json, error_responses.json, ...")
+        print("   🔌 API Mocks: all_mocks.json (perfect, partial, zero, error, ...)")
         print("   📊 Excel Outputs: perfect_student_marks.xlsx, ...")
         print("✅ Dry run completed")
         return
@@ -4,20 +4,62 @@ Model loader module for pre-trained MIPRO models.
 This module handles loading and managing pre-trained DSPy models from the
 programs directory and provides functionality to work with different
 marker configurations.
+
+Model files are pickles and must come from a trusted source: unpickling can
+execute arbitrary code, and no allowlist is applied.
 """
 
 import os
+import functools
+import mmap
 import dspy
 import pickle
 import toml
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 import logging
 
 from .dspy_config import create_dynamic_signature_class, create_dynamic_signature_instance
 
 logger = logging.getLogger(__name__)
 
+# Model files larger than this are memory-mapped rather than read into memory
+MMAP_THRESHOLD_BYTES = 64 * 1024 * 1024
+
+
+@functools.lru_cache(maxsize=128)
+def _select_best_model(marker_name: str,
+                       available_models: Tuple[Tuple[str, str], ...]) -> Optional[str]:
+    """
+    Select the best model for a marker from a sorted tuple of model names.
+    
+    Args:
+        marker_name: Name of the marker
+        available_models: Sorted (model name, casefolded model name) pairs
+        
+    Returns:
+        Best model name or None if no suitable model found
+    """
+    # Look for models that match the marker name
+    marker_folded = marker_name.casefold()
+    matching_models = [
+        model for model, model_folded in available_models 
+        if marker_folded in model_folded
+    ]
+    
+    if not matching_models:
+        return None
+    
+    # Prefer MIPRO models with higher optimization scores; the highest name
+    # is the most recent/best version
+    best_model = max((model for model in matching_models if 'MIPRO' in model), default=None)
+    
+    if best_model is not None:
+        return best_model
+    
+    # Fallback to any matching model
+    return max(matching_models)
+
 
 class ModelLoader:
     """Loader for pre-trained MIPRO models and marker configurations."""
@@ -36,6 +78,8 @@ class ModelLoader:
         self.marking_config_file = Path(marking_config_file)
         self.loaded_models: Dict[str, Any] = {}
         self.marker_configs: Dict[str, Dict[str, Any]] = {}
+        self._models_cache: Optional[Tuple[int, Tuple[str, ...]]] = None
+        self._models_folded_cache: Optional[Tuple[int, Tuple[Tuple[str, str], ...]]] = None
         
         if not self.programs_dir.exists():
             raise FileNotFoundError(f"Programs directory not found: {programs_dir}")
@@ -74,16 +118,54 @@ class ModelLoader:
         """
         List all available pre-trained models in the programs directory.
         
+        The listing is cached until the directory's modification time changes.
+        
         Returns:
             List of model names
         """
-        model_files = []
-        for file_path in self.programs_dir.iterdir():
-            if file_path.is_file():
-                model_files.append(file_path.name)
+        return list(self._get_available_models())
+    
+    def _get_available_models(self) -> Tuple[str, ...]:
+        """
+        Get the cached, sorted model names, rescanning if the directory changed.
+        
+        Returns:
+            Sorted tuple of model names
+        """
+        mtime_ns = os.stat(self.programs_dir).st_mtime_ns
+        if self._models_cache is not None and self._models_cache[0] == mtime_ns:
+            return self._models_cache[1]
+        
+        # DirEntry.is_file() is answered from the directory read, avoiding a
+        # stat() per entry on most filesystems
+        with os.scandir(self.programs_dir) as entries:
+            models = tuple(sorted(
+                entry.name for entry in entries
+                if entry.is_file()
+            ))
+        
+        self._models_cache = (mtime_ns, models)
+        logger.info(f"Found {len(models)} available models")
+        return models
+    
+    def _get_available_models_folded(self) -> Tuple[Tuple[str, str], ...]:
+        """
+        Get the cached model names paired with their casefolded form.
+        
+        Shares the directory mtime key of the listing cache, so the folded
+        names are only recomputed when the directory changes.
+        
+        Returns:
+            Sorted tuple of (model name, casefolded model name) pairs
+        """
+        models = self._get_available_models()
+        mtime_ns = self._models_cache[0]
+        if self._models_folded_cache is not None and self._models_folded_cache[0] == mtime_ns:
+            return self._models_folded_cache[1]
         
-        logger.info(f"Found {len(model_files)} available models")
-        return sorted(model_files)
+        folded = tuple((model, model.casefold()) for model in models)
+        self._models_folded_cache = (mtime_ns, folded)
+        return folded
     
     def load_pretrained_model(self, model_name: str) -> Any:
         """
@@ -106,9 +188,8 @@ class ModelLoader:
                 logger.info(f"Using cached model: {model_name}")
                 return self.loaded_models[model_name]
             
-            # Load the model
-            with open(model_path, 'rb') as f:
-                model = pickle.load(f)
+            # Load the model from a single buffer rather than streaming reads
+            model = self._unpickle_file(model_path)
             
             self.loaded_models[model_name] = model
             logger.info(f"Successfully loaded model: {model_name}")
@@ -118,6 +199,26 @@ class ModelLoader:
             logger.error(f"Failed to load model {model_name}: {e}")
             raise
     
+    def _unpickle_file(self, model_path: Path) -> Any:
+        """
+        Unpickle a model file from an in-memory buffer.
+        
+        Small files are read in one call; large files are memory-mapped so the
+        unpickler works directly on the page cache without a user-space copy.
+        
+        Args:
+            model_path: Path to the pickled model file
+            
+        Returns:
+            Unpickled object
+        """
+        if model_path.stat().st_size <= MMAP_THRESHOLD_BYTES:
+            return pickle.loads(model_path.read_bytes())
+        
+        with open(model_path, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return pickle.loads(mm)
+    
     def create_marker_with_dynamic_scale(self, 
                                        marker_name: str, 
                                        max_points: int = 10) -> Any:
@@ -167,30 +268,14 @@ class ModelLoader:
         Returns:
             Best model name or None if no suitable model found
         """
-        available_models = self.list_available_models()
+        best_model = _select_best_model(marker_name, self._get_available_models_folded())
         
-        # Look for models that match the marker name
-        matching_models = [
-            model for model in available_models 
-            if marker_name.lower() in model.lower()
-        ]
-        
-        if not matching_models:
+        if best_model is None:
             logger.warning(f"No pre-trained models found for marker: {marker_name}")
-            return None
-        
-        # Prefer MIPRO models with higher optimization scores
-        mipro_models = [model for model in matching_models if 'MIPRO' in model]
-        
-        if mipro_models:
-            # Sort by name to get the most recent/best version
-            best_model = sorted(mipro_models)[-1]
+        elif 'MIPRO' in best_model:
             logger.info(f"Selected best model for {marker_name}: {best_model}")
-            return best_model
-        
-        # Fallback to any matching model
-        best_model = sorted(matching_models)[-1]
-        logger.info(f"Selected fallback model for {marker_name}: {best_model}")
+        else:
+            logger.info(f"Selected fallback model for {marker_name}: {best_model}")
         return best_model
     
     def create_optimized_marker(self, 
@@ -5,9 +5,12 @@ This module creates Excel files containing task-by-task marking results
 with proper formatting, error flags, and summary sections.
 """
 
-import xlsxwriter
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, List, Any, Mapping, Optional, Tuple, Union
 import logging
 from datetime import datetime
 
@@ -15,12 +18,50 @@ from .formatting import ExcelFormatter
 
 logger = logging.getLogger(__name__)
 
+# Marking sheets are written strictly top to bottom, so rows can be flushed
+# to disk as they are completed instead of being held in memory
+MARKING_SHEET_WORKBOOK_OPTIONS = {
+    'constant_memory': True,
+    'strings_to_urls': False,
+    'strings_to_formulas': False,
+    'strings_to_numbers': False,
+}
+
+# Error types in an issue that require a human to review the criterion
+_MANUAL_REVIEW_RE = re.compile(r'PARSING_ERROR|API_ERROR|TIMEOUT_ERROR')
+
 
 class ExcelGenerationError(Exception):
     """Custom exception for Excel generation errors."""
     pass
 
 
+# (student_id, rubric_data, marking_results, issues) for one marking sheet
+MarkingSheetJob = Tuple[
+    str,
+    Dict[int, List[Dict[str, Any]]],
+    Dict[int, List[Dict[str, Any]]],
+    Optional[List[str]]
+]
+
+
+def _generate_marking_sheet_job(output_dir: str, job: MarkingSheetJob) -> Path:
+    """
+    Generate one marking sheet in a worker process.
+    
+    Args:
+        output_dir: Directory where the Excel file will be saved
+        job: Marking sheet inputs for one student
+        
+    Returns:
+        Path to the generated Excel file
+    """
+    student_id, rubric_data, marking_results, issues = job
+    return ExcelGenerator(output_dir).generate_marking_sheet(
+        student_id, rubric_data, marking_results, issues
+    )
+
+
 class ExcelGenerator:
     """
     Generator for creating Excel marking sheets for individual students.
@@ -29,6 +70,22 @@ class ExcelGenerator:
     subtotals, error flags, and issues summary.
     """
     
+    # Style mappings are shared module constants, collected once for every workbook
+    _STYLE_SPECS: Dict[str, Mapping[str, Any]] = {
+        'header': ExcelFormatter.get_header_style(),
+        'task_header': ExcelFormatter.get_task_header_style(),
+        'criterion': ExcelFormatter.get_criterion_style(),
+        'score': ExcelFormatter.get_score_style(),
+        'error_score': ExcelFormatter.get_error_score_style(),
+        'subtotal': ExcelFormatter.get_subtotal_style(),
+        'total': ExcelFormatter.get_total_style(),
+        'issues_header': ExcelFormatter.get_issues_header_style(),
+        'issues': ExcelFormatter.get_issues_style()
+    }
+    
+    # Upper bound on memoized per-student output paths
+    _MAX_CACHED_OUTPUT_PATHS = 4096
+    
     def __init__(self, output_dir: Union[str, Path]):
         """
         Initialize the Excel generator.
@@ -41,6 +98,7 @@ class ExcelGenerator:
         """
         self.output_dir = Path(output_dir)
         self.formatter = ExcelFormatter()
+        self._output_paths: Dict[str, Path] = {}
         
         # Create output directory if it doesn't exist
         try:
@@ -72,39 +130,153 @@ class ExcelGenerator:
         Raises:
             ExcelGenerationError: If generation fails
         """
-        output_file = self.output_dir / f"{student_id}_marks.xlsx"
+        output_file = self.get_output_path(student_id)
+        
+        # Imported lazily so importing src.output stays cheap
+        import xlsxwriter
         
         try:
-            workbook = xlsxwriter.Workbook(str(output_file))
-            worksheet = workbook.add_worksheet('Marking Sheet')
+            with xlsxwriter.Workbook(str(output_file), MARKING_SHEET_WORKBOOK_OPTIONS) as workbook:
+                worksheet = workbook.add_worksheet('Marking Sheet')
+                
+                # Create format objects
+                formats = self._create_formats(workbook)
+                
+                self._write_marking_sheet(
+                    workbook, worksheet, formats, rubric_data, marking_results, issues
+                )
             
-            # Apply general formatting
-            self.formatter.apply_worksheet_formatting(worksheet, workbook)
+            logger.info(f"Generated marking sheet: {output_file}")
+            return output_file
             
-            # Create format objects
-            formats = self._create_formats(workbook)
+        except Exception as e:
+            raise ExcelGenerationError(f"Failed to generate Excel file: {e}") from e
+    
+    def generate_marking_sheets_batch(
+        self,
+        jobs: List[MarkingSheetJob],
+        workers: Optional[int] = None
+    ) -> List[Path]:
+        """
+        Generate marking sheets for many students in parallel processes.
+        
+        Each student's sheet is independent and CPU-bound in XML
+        serialization, so the jobs are spread across a process pool.
+        
+        Args:
+            jobs: List of (student_id, rubric_data, marking_results, issues) tuples
+            workers: Number of worker processes (defaults to the CPU count)
             
-            # Write content
-            current_row = 0
-            current_row = self._write_header(worksheet, formats, current_row)
-            current_row = self._write_tasks(worksheet, formats, rubric_data, marking_results, current_row)
-            current_row = self._write_grand_total(worksheet, formats, rubric_data, marking_results, current_row)
+        Returns:
+            Paths to the generated Excel files, in job order
             
-            if issues:
-                current_row = self._write_issues_section(worksheet, formats, issues, current_row)
+        Raises:
+            ExcelGenerationError: If generation fails for any student
+        """
+        if not jobs:
+            return []
+        
+        workers = min(workers or os.cpu_count() or 1, len(jobs))
+        
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            paths = list(executor.map(
+                _generate_marking_sheet_job, repeat(str(self.output_dir)), jobs, chunksize=8
+            ))
+        
+        logger.info(f"Generated {len(paths)} marking sheets using {workers} workers")
+        return paths
+    
+    def generate_marking_sheets_multi(
+        self,
+        per_student: Dict[str, Tuple[
+            Dict[int, List[Dict[str, Any]]],
+            Dict[int, List[Dict[str, Any]]],
+            Optional[List[str]]
+        ]],
+        filename: str = "marking_sheets.xlsx"
+    ) -> Path:
+        """
+        Generate one workbook containing a marking sheet per student.
+        
+        Formats are created once and shared by every worksheet, and the
+        workbook is packaged a single time.
+        
+        Args:
+            per_student: Dictionary mapping student IDs to
+                (rubric_data, marking_results, issues) tuples
+            filename: Name for the combined workbook
             
-            workbook.close()
+        Returns:
+            Path to the generated Excel file
             
-            logger.info(f"Generated marking sheet: {output_file}")
+        Raises:
+            ExcelGenerationError: If generation fails
+        """
+        output_file = self.output_dir / filename
+        
+        import xlsxwriter
+        
+        try:
+            with xlsxwriter.Workbook(str(output_file), MARKING_SHEET_WORKBOOK_OPTIONS) as workbook:
+                formats = self._create_formats(workbook)
+                
+                for student_id, (rubric_data, marking_results, issues) in sorted(per_student.items()):
+                    # Excel limits worksheet names to 31 characters
+                    worksheet = workbook.add_worksheet(str(student_id)[:31])
+                    self._write_marking_sheet(
+                        workbook, worksheet, formats, rubric_data, marking_results, issues
+                    )
+            
+            logger.info(f"Generated {len(per_student)} marking sheets in: {output_file}")
             return output_file
             
         except Exception as e:
-            if 'workbook' in locals():
-                try:
-                    workbook.close()
-                except:
-                    pass
-            raise ExcelGenerationError(f"Failed to generate Excel file: {e}")
+            raise ExcelGenerationError(f"Failed to generate Excel file: {e}") from e
+    
+    def _write_marking_sheet(
+        self,
+        workbook,
+        worksheet,
+        formats: Dict[str, Any],
+        rubric_data: Dict[int, List[Dict[str, Any]]],
+        marking_results: Dict[int, List[Dict[str, Any]]],
+        issues: Optional[List[str]]
+    ) -> int:
+        """
+        Write the full marking sheet content to a worksheet.
+        
+        Args:
+            workbook: xlsxwriter workbook object
+            worksheet: xlsxwriter worksheet object
+            formats: Dictionary of format objects
+            rubric_data: Rubric criteria data
+            marking_results: Marking scores and flags
+            issues: List of issues encountered during marking
+            
+        Returns:
+            Next available row number
+        """
+        # Apply general formatting (column widths must be set before any writes)
+        self.formatter.apply_worksheet_formatting(worksheet, workbook)
+        
+        # Structural problems are found while writing the tasks rather than
+        # in a separate validate_input_data pass
+        structural_issues: List[str] = []
+        
+        current_row = 0
+        current_row = self._write_header(worksheet, formats, current_row)
+        current_row, grand_total_score, grand_total_max = self._write_tasks(
+            worksheet, formats, rubric_data, marking_results, current_row, structural_issues
+        )
+        current_row = self._write_grand_total(
+            worksheet, formats, grand_total_score, grand_total_max, current_row
+        )
+        
+        all_issues = structural_issues + (issues or [])
+        if all_issues:
+            current_row = self._write_issues_section(worksheet, formats, all_issues, current_row)
+        
+        return current_row
     
     def _create_formats(self, workbook) -> Dict[str, Any]:
         """
@@ -117,15 +289,8 @@ class ExcelGenerator:
             Dictionary of format objects
         """
         return {
-            'header': self.formatter.create_format(workbook, self.formatter.get_header_style()),
-            'task_header': self.formatter.create_format(workbook, self.formatter.get_task_header_style()),
-            'criterion': self.formatter.create_format(workbook, self.formatter.get_criterion_style()),
-            'score': self.formatter.create_format(workbook, self.formatter.get_score_style()),
-            'error_score': self.formatter.create_format(workbook, self.formatter.get_error_score_style()),
-            'subtotal': self.formatter.create_format(workbook, self.formatter.get_subtotal_style()),
-            'total': self.formatter.create_format(workbook, self.formatter.get_total_style()),
-            'issues_header': self.formatter.create_format(workbook, self.formatter.get_issues_header_style()),
-            'issues': self.formatter.create_format(workbook, self.formatter.get_issues_style())
+            name: self.formatter.create_format(workbook, style)
+            for name, style in self._STYLE_SPECS.items()
         }
     
     def _write_header(self, worksheet, formats: Dict[str, Any], start_row: int) -> int:
@@ -142,8 +307,7 @@ class ExcelGenerator:
         """
         headers = ['Task Name', 'Criterion Description', 'Student Score', 'Max Points']
         
-        for col, header in enumerate(headers):
-            worksheet.write(start_row, col, header, formats['header'])
+        worksheet.write_row(start_row, 0, headers, formats['header'])
         
         logger.debug("Wrote header row")
         return start_row + 1
@@ -154,8 +318,9 @@ class ExcelGenerator:
         formats: Dict[str, Any], 
         rubric_data: Dict[int, List[Dict[str, Any]]],
         marking_results: Dict[int, List[Dict[str, Any]]],
-        start_row: int
-    ) -> int:
+        start_row: int,
+        structural_issues: Optional[List[str]] = None
+    ) -> Tuple[int, float, float]:
         """
         Write all task sections with criteria and scores.
         
@@ -165,25 +330,54 @@ class ExcelGenerator:
             rubric_data: Rubric criteria data
             marking_results: Marking scores and flags
             start_row: Starting row number
+            structural_issues: Optional list to append rubric/result mismatches to
             
         Returns:
-            Next available row number
+            Tuple of (next available row number, grand total score, grand total max points)
         """
         current_row = start_row
+        grand_total_score = 0
+        grand_total_max = 0
         
         # Sort tasks by number
         task_numbers = sorted(rubric_data.keys())
         
         for task_num in task_numbers:
-            current_row = self._write_task_section(
+            criteria = rubric_data[task_num]
+            results = marking_results.get(task_num, [])
+            
+            if structural_issues is not None:
+                issue = self._check_task_results(task_num, criteria, results)
+                if issue:
+                    structural_issues.append(issue)
+            
+            current_row, task_score, task_max = self._write_task_section(
                 worksheet, formats, task_num, 
-                rubric_data[task_num], 
-                marking_results.get(task_num, []),
+                criteria, 
+                self._index_results(results),
                 current_row
             )
+            grand_total_score += task_score
+            grand_total_max += task_max
             current_row += 1  # Add spacing between tasks
         
-        return current_row
+        if structural_issues is not None:
+            structural_issues.extend(self._unknown_task_issues(rubric_data, marking_results))
+        
+        return current_row, grand_total_score, grand_total_max
+    
+    @staticmethod
+    def _index_results(results: List[Dict[str, Any]]) -> Dict[int, Dict[str, Any]]:
+        """
+        Index a task's marking results by criterion.
+        
+        Args:
+            results: List of marking results for a task
+            
+        Returns:
+            Dictionary mapping criterion index to its result
+        """
+        return {r.get('criterion_index', idx): r for idx, r in enumerate(results)}
     
     def _write_task_section(
         self,
@@ -191,9 +385,9 @@ class ExcelGenerator:
         formats: Dict[str, Any],
         task_num: int,
         criteria: List[Dict[str, Any]],
-        results: List[Dict[str, Any]],
+        results_lookup: Dict[int, Dict[str, Any]],
         start_row: int
-    ) -> int:
+    ) -> Tuple[int, float, float]:
         """
         Write a single task section with all its criteria.
         
@@ -202,87 +396,128 @@ class ExcelGenerator:
             formats: Dictionary of format objects
             task_num: Task number
             criteria: List of criteria for this task
-            results: List of marking results for this task
+            results_lookup: Marking results for this task, indexed by criterion
             start_row: Starting row number
             
         Returns:
-            Next available row number
+            Tuple of (next available row number, task score, task max points)
         """
         current_row = start_row
-        
-        # Create results lookup for quick access
-        results_lookup = {r.get('criterion_index', idx): r for idx, r in enumerate(results)}
-        
-        # Write each criterion
-        for idx, criterion in enumerate(criteria):
-            task_name = f"Task {task_num}" if idx == 0 else ""
-            criterion_desc = criterion['criterion']
-            max_points = criterion['max_points']
-            
-            # Get result for this criterion
-            result = results_lookup.get(idx, {})
-            score_value = result.get('score', 0)
-            error_flag = result.get('error_flag')
-            
-            # Format score cell
-            if error_flag:
-                score_text = self.formatter.format_error_flag(error_flag)
-                score_format = formats['error_score']
+        task_header_format = formats['task_header']
+        criterion_format = formats['criterion']
+        score_format = formats['score']
+        error_score_format = formats['error_score']
+        write_string = worksheet.write_string
+        write_number = worksheet.write_number
+        
+        rows = self._prepare_task_rows(criteria, results_lookup)
+        task_max = sum(row[3] for row in rows)
+        
+        # Write each criterion, using the typed write methods to skip the
+        # type dispatch done by worksheet.write()
+        for idx, (description, score_cell, is_error, max_points) in enumerate(rows):
+            if idx == 0:
+                write_string(current_row, 0, f"Task {task_num}", task_header_format)
             else:
-                score_text = score_value
-                score_format = formats['score']
+                worksheet.write_blank(current_row, 0, None, task_header_format)
+            write_string(current_row, 1, description, criterion_format)
             
-            # Write row
-            worksheet.write(current_row, 0, task_name, formats['task_header'])
-            worksheet.write(current_row, 1, criterion_desc, formats['criterion'])
-            worksheet.write(current_row, 2, score_text, score_format)
-            worksheet.write(current_row, 3, max_points, formats['score'])
+            if is_error:
+                write_string(current_row, 2, score_cell, error_score_format)
+            else:
+                worksheet.write(current_row, 2, score_cell, score_format)
             
+            write_number(current_row, 3, max_points, score_format)
             current_row += 1
         
+        # Calculate subtotal from the written rows so it matches the SUM
+        # formula (only count non-error scores)
+        task_score = sum(0 if row[2] else row[1] for row in rows)
+        
         # Write subtotal
-        current_row = self._write_subtotal(worksheet, formats, task_num, criteria, results, current_row)
+        current_row = self._write_subtotal(
+            worksheet, formats, task_score, task_max, start_row, current_row
+        )
         
         logger.debug(f"Wrote Task {task_num} section")
-        return current_row
+        return current_row, task_score, task_max
+    
+    def _prepare_task_rows(
+        self,
+        criteria: List[Dict[str, Any]],
+        results_lookup: Dict[int, Dict[str, Any]]
+    ) -> List[Tuple[str, Any, bool, Any]]:
+        """
+        Resolve each criterion's cell values before writing.
+        
+        Args:
+            criteria: List of criteria for this task
+            results_lookup: Marking results for this task, indexed by criterion
+            
+        Returns:
+            List of (description, score cell value, is error, max points) tuples
+        """
+        format_error_flag = self.formatter.format_error_flag
+        rows = []
+        
+        for idx, criterion in enumerate(criteria):
+            result = results_lookup.get(idx)
+            error_flag = result.get('error_flag') if result else None
+            
+            if error_flag:
+                score_cell = format_error_flag(error_flag)
+            else:
+                score_cell = result.get('score', 0) if result else 0
+            
+            rows.append((criterion['criterion'], score_cell, bool(error_flag), criterion['max_points']))
+        
+        return rows
     
     def _write_subtotal(
         self,
         worksheet,
         formats: Dict[str, Any],
-        task_num: int,
-        criteria: List[Dict[str, Any]],
-        results: List[Dict[str, Any]],
+        subtotal_score: float,
+        max_points: float,
+        first_row: int,
         row: int
     ) -> int:
         """
         Write subtotal row for a task.
         
+        The totals are written as SUM formulas over the task's criterion rows,
+        with the Python-side values cached as the formula results so the
+        file reads correctly without recalculation. Error-flagged scores are
+        text cells, which SUM ignores.
+        
         Args:
             worksheet: xlsxwriter worksheet object
             formats: Dictionary of format objects
-            task_num: Task number
-            criteria: List of criteria for this task
-            results: List of marking results for this task
+            subtotal_score: Task score, excluding error-flagged criteria
+            max_points: Maximum points for the task
+            first_row: Row number of the task's first criterion
             row: Row number for subtotal
             
         Returns:
             Next available row number
         """
-        # Calculate subtotal (only count non-error scores)
-        subtotal_score = sum(
-            r.get('score', 0) for r in results 
-            if not r.get('error_flag')
-        )
-        
-        # Calculate max points for task
-        max_points = sum(c['max_points'] for c in criteria)
+        subtotal_format = formats['subtotal']
         
         # Write subtotal row
-        worksheet.write(row, 0, "", formats['subtotal'])
-        worksheet.write(row, 1, "SUBTOTAL", formats['subtotal'])
-        worksheet.write(row, 2, subtotal_score, formats['subtotal'])
-        worksheet.write(row, 3, max_points, formats['subtotal'])
+        worksheet.write_blank(row, 0, None, subtotal_format)
+        worksheet.write_string(row, 1, "SUBTOTAL", subtotal_format)
+        
+        if row > first_row:
+            # Excel rows are 1-based
+            worksheet.write_formula(
+                row, 2, f"=SUM(C{first_row + 1}:C{row})", subtotal_format, subtotal_score
+            )
+            worksheet.write_formula(
+                row, 3, f"=SUM(D{first_row + 1}:D{row})", subtotal_format, max_points
+            )
+        else:
+            worksheet.write_number(row, 2, subtotal_score, subtotal_format)
+            worksheet.write_number(row, 3, max_points, subtotal_format)
         
         return row + 1
     
@@ -290,46 +525,42 @@ class ExcelGenerator:
         self,
         worksheet,
         formats: Dict[str, Any],
-        rubric_data: Dict[int, List[Dict[str, Any]]],
-        marking_results: Dict[int, List[Dict[str, Any]]],
+        grand_total_score: float,
+        grand_total_max: float,
         start_row: int
     ) -> int:
         """
         Write grand total row.
         
+        The totals are SUMIF formulas over the SUBTOTAL rows above, with the
+        accumulated values cached as the formula results.
+        
         Args:
             worksheet: xlsxwriter worksheet object
             formats: Dictionary of format objects
-            rubric_data: Rubric criteria data
-            marking_results: Marking scores and flags
+            grand_total_score: Sum of task subtotals accumulated by _write_tasks
+            grand_total_max: Sum of task max points accumulated by _write_tasks
             start_row: Starting row number
             
         Returns:
             Next available row number
         """
-        # Calculate grand total
-        grand_total_score = 0
-        grand_total_max = 0
+        total_format = formats['total']
         
-        for task_num, criteria in rubric_data.items():
-            results = marking_results.get(task_num, [])
-            
-            # Add scores (excluding errors)
-            task_score = sum(
-                r.get('score', 0) for r in results 
-                if not r.get('error_flag')
-            )
-            grand_total_score += task_score
-            
-            # Add max points
-            task_max = sum(c['max_points'] for c in criteria)
-            grand_total_max += task_max
+        # Rows 2 to start_row (1-based) hold the task sections below the header
+        label_range = f"B2:B{start_row}"
         
         # Write grand total row
-        worksheet.write(start_row, 0, "", formats['total'])
-        worksheet.write(start_row, 1, "GRAND TOTAL", formats['total'])
-        worksheet.write(start_row, 2, grand_total_score, formats['total'])
-        worksheet.write(start_row, 3, grand_total_max, formats['total'])
+        worksheet.write_blank(start_row, 0, None, total_format)
+        worksheet.write_string(start_row, 1, "GRAND TOTAL", total_format)
+        worksheet.write_formula(
+            start_row, 2, f'=SUMIF({label_range},"SUBTOTAL",C2:C{start_row})',
+            total_format, grand_total_score
+        )
+        worksheet.write_formula(
+            start_row, 3, f'=SUMIF({label_range},"SUBTOTAL",D2:D{start_row})',
+            total_format, grand_total_max
+        )
         
         logger.debug(f"Wrote grand total: {grand_total_score}/{grand_total_max}")
         return start_row + 1
@@ -354,33 +585,24 @@ class ExcelGenerator:
             Next available row number
         """
         current_row = start_row + 1  # Add some spacing
+        issues_format = formats['issues']
         
         # Write issues header
-        worksheet.write(current_row, 0, "ISSUES FOUND:", formats['issues_header'])
-        worksheet.write(current_row, 1, "", formats['issues_header'])
-        worksheet.write(current_row, 2, "", formats['issues_header'])
-        worksheet.write(current_row, 3, "", formats['issues_header'])
+        worksheet.write_row(current_row, 0, ["ISSUES FOUND:", "", "", ""], formats['issues_header'])
         current_row += 1
         
-        # Write each issue
+        # Write each issue as a whole row; rows must stay in order because
+        # the workbook flushes completed rows in constant_memory mode
         for issue in issues:
-            worksheet.write(current_row, 0, "•", formats['issues'])
-            worksheet.write(current_row, 1, issue, formats['issues'])
-            worksheet.write(current_row, 2, "", formats['issues'])
-            worksheet.write(current_row, 3, "", formats['issues'])
+            worksheet.write_row(current_row, 0, ("•", issue, "", ""), issues_format)
             current_row += 1
         
         # Add summary line
-        manual_review_count = len([i for i in issues if any(
-            keyword in i for keyword in ['PARSING_ERROR', 'API_ERROR', 'TIMEOUT_ERROR']
-        )])
+        manual_review_count = sum(1 for i in issues if _MANUAL_REVIEW_RE.search(i))
         
         if manual_review_count > 0:
             summary = f"Manual review required for {manual_review_count} items"
-            worksheet.write(current_row, 0, "•", formats['issues'])
-            worksheet.write(current_row, 1, summary, formats['issues'])
-            worksheet.write(current_row, 2, "", formats['issues'])
-            worksheet.write(current_row, 3, "", formats['issues'])
+            worksheet.write_row(current_row, 0, ("•", summary, "", ""), issues_format)
             current_row += 1
         
         logger.debug(f"Wrote issues section with {len(issues)} issues")
@@ -406,53 +628,48 @@ class ExcelGenerator:
         """
         output_file = self.output_dir / summary_filename
         
+        import xlsxwriter
+        
         try:
-            workbook = xlsxwriter.Workbook(str(output_file))
-            worksheet = workbook.add_worksheet('Batch Summary')
-            
-            # Create formats
-            formats = self._create_formats(workbook)
-            
-            # Write headers
-            headers = ['Student ID', 'Total Score', 'Max Points', 'Percentage', 'Issues Count', 'Status']
-            for col, header in enumerate(headers):
-                worksheet.write(0, col, header, formats['header'])
-            
-            # Write data
-            row = 1
-            for student_id, result in sorted(batch_results.items()):
-                total_score = result.get('total_score', 0)
-                max_points = result.get('max_points', 0)
-                percentage = (total_score / max_points * 100) if max_points > 0 else 0
-                issues_count = len(result.get('issues', []))
-                status = result.get('status', 'Unknown')
+            with xlsxwriter.Workbook(str(output_file)) as workbook:
+                worksheet = workbook.add_worksheet('Batch Summary')
                 
-                worksheet.write(row, 0, student_id, formats['criterion'])
-                worksheet.write(row, 1, total_score, formats['score'])
-                worksheet.write(row, 2, max_points, formats['score'])
-                worksheet.write(row, 3, f"{percentage:.1f}%", formats['score'])
-                worksheet.write(row, 4, issues_count, formats['score'])
-                worksheet.write(row, 5, status, formats['criterion'])
+                # Create formats
+                formats = self._create_formats(workbook)
                 
-                row += 1
-            
-            # Set column widths
-            worksheet.set_column(0, 0, 15)  # Student ID
-            worksheet.set_column(1, 4, 12)  # Numeric columns
-            worksheet.set_column(5, 5, 15)  # Status
-            
-            workbook.close()
+                # Write headers
+                headers = ['Student ID', 'Total Score', 'Max Points', 'Percentage', 'Issues Count', 'Status']
+                for col, header in enumerate(headers):
+                    worksheet.write(0, col, header, formats['header'])
+                
+                # Write data
+                row = 1
+                for student_id, result in sorted(batch_results.items()):
+                    total_score = result.get('total_score', 0)
+                    max_points = result.get('max_points', 0)
+                    percentage = (total_score / max_points * 100) if max_points > 0 else 0
+                    issues_count = len(result.get('issues', []))
+                    status = result.get('status', 'Unknown')
+                    
+                    worksheet.write(row, 0, student_id, formats['criterion'])
+                    worksheet.write(row, 1, total_score, formats['score'])
+                    worksheet.write(row, 2, max_points, formats['score'])
+                    worksheet.write(row, 3, f"{percentage:.1f}%", formats['score'])
+                    worksheet.write(row, 4, issues_count, formats['score'])
+                    worksheet.write(row, 5, status, formats['criterion'])
+                    
+                    row += 1
+                
+                # Set column widths
+                worksheet.set_column(0, 0, 15)  # Student ID
+                worksheet.set_column(1, 4, 12)  # Numeric columns
+                worksheet.set_column(5, 5, 15)  # Status
             
             logger.info(f"Generated batch summary: {output_file}")
             return output_file
             
         except Exception as e:
-            if 'workbook' in locals():
-                try:
-                    workbook.close()
-                except:
-                    pass
-            raise ExcelGenerationError(f"Failed to generate batch summary: {e}")
+            raise ExcelGenerationError(f"Failed to generate batch summary: {e}") from e
     
     def validate_input_data(
         self,
@@ -473,24 +690,63 @@ class ExcelGenerator:
         
         # Check that all rubric tasks have corresponding results
         for task_num, criteria in rubric_data.items():
-            results = marking_results.get(task_num, [])
-            
-            if not results:
-                issues.append(f"No results found for Task {task_num}")
-                continue
+            issue = self._check_task_results(task_num, criteria, marking_results.get(task_num, []))
+            if issue:
+                issues.append(issue)
+        
+        issues.extend(self._unknown_task_issues(rubric_data, marking_results))
+        return issues
+    
+    @staticmethod
+    def _check_task_results(
+        task_num: int,
+        criteria: List[Dict[str, Any]],
+        results: List[Dict[str, Any]]
+    ) -> Optional[str]:
+        """
+        Check a task's results against its rubric criteria.
+        
+        Args:
+            task_num: Task number
+            criteria: List of criteria for this task
+            results: List of marking results for this task
             
-            # Check criteria count matches
-            if len(results) != len(criteria):
-                issues.append(
-                    f"Task {task_num}: Expected {len(criteria)} results, got {len(results)}"
-                )
+        Returns:
+            Description of the mismatch, or None if the task is consistent
+        """
+        if not results:
+            return f"No results found for Task {task_num}"
         
-        # Check for extra results not in rubric
-        for task_num in marking_results:
-            if task_num not in rubric_data:
-                issues.append(f"Results found for unknown Task {task_num}")
+        # Check criteria count matches
+        if len(results) != len(criteria):
+            return f"Task {task_num}: Expected {len(criteria)} results, got {len(results)}"
         
-        return issues
+        return None
+    
+    @staticmethod
+    def _unknown_task_issues(
+        rubric_data: Dict[int, List[Dict[str, Any]]],
+        marking_results: Dict[int, List[Dict[str, Any]]]
+    ) -> List[str]:
+        """
+        Report results for tasks that are not in the rubric.
+        
+        Args:
+            rubric_data: Dictionary mapping task numbers to criteria lists
+            marking_results: Dictionary mapping task numbers to scored criteria
+            
+        Returns:
+            List of issues for unknown tasks
+        """
+        # Short-circuit the common case where both cover the same tasks
+        if marking_results.keys() <= rubric_data.keys():
+            return []
+        
+        return [
+            f"Results found for unknown Task {task_num}"
+            for task_num in marking_results
+            if task_num not in rubric_data
+        ]
     
     def get_output_path(self, student_id: str) -> Path:
         """
@@ -502,4 +758,10 @@ class ExcelGenerator:
         Returns:
             Expected file path
         """
-        return self.output_dir / f"{student_id}_marks.xlsx"
+        output_path = self._output_paths.get(student_id)
+        if output_path is None:
+            if len(self._output_paths) >= self._MAX_CACHED_OUTPUT_PATHS:
+                self._output_paths.clear()
+            output_path = self.output_dir / f"{student_id}_marks.xlsx"
+            self._output_paths[student_id] = output_path
+        return output_path
@@ -5,11 +5,130 @@ This module provides formatting functions and styles for creating
 professional-looking Excel marking sheets with consistent styling.
 """
 
-from typing import Dict, Any
+import weakref
+from types import MappingProxyType
+from typing import Callable, Dict, Any, Mapping
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Format objects already created per workbook, keyed by style properties.
+# Weak keys let a workbook's formats be dropped once it is garbage collected.
+_format_cache: "weakref.WeakKeyDictionary[Any, Dict[frozenset, Any]]" = weakref.WeakKeyDictionary()
+
+# Style property name -> Format setter, built once per format class
+_setter_tables: Dict[type, Dict[str, Callable]] = {}
+
+
+def _get_setter_table(format_class: type) -> Dict[str, Callable]:
+    """
+    Get the mapping of style property names to setter methods for a format class.
+    
+    Args:
+        format_class: Class of the xlsxwriter format objects
+        
+    Returns:
+        Dictionary mapping property names (e.g. 'bold') to unbound setters
+    """
+    table = _setter_tables.get(format_class)
+    if table is None:
+        table = {
+            name[len('set_'):]: getattr(format_class, name)
+            for name in dir(format_class)
+            if name.startswith('set_') and callable(getattr(format_class, name))
+        }
+        _setter_tables[format_class] = table
+    return table
+
+
+# Static cell styles, shared read-only by every workbook
+_HEADER_STYLE = MappingProxyType({
+    'bold': True,
+    'bg_color': '#4472C4',
+    'font_color': 'white',
+    'border': 1,
+    'align': 'center',
+    'valign': 'vcenter'
+})
+
+_TASK_HEADER_STYLE = MappingProxyType({
+    'bold': True,
+    'bg_color': '#D9E2F3',
+    'font_color': 'black',
+    'border': 1,
+    'align': 'left',
+    'valign': 'vcenter'
+})
+
+_CRITERION_STYLE = MappingProxyType({
+    'border': 1,
+    'align': 'left',
+    'valign': 'top',
+    'text_wrap': True
+})
+
+_SCORE_STYLE = MappingProxyType({
+    'border': 1,
+    'align': 'center',
+    'valign': 'vcenter',
+    'num_format': '0'
+})
+
+_ERROR_SCORE_STYLE = MappingProxyType({
+    'border': 1,
+    'align': 'center',
+    'valign': 'vcenter',
+    'bg_color': '#FFE6E6',
+    'font_color': '#D00000'
+})
+
+_SUBTOTAL_STYLE = MappingProxyType({
+    'bold': True,
+    'bg_color': '#F2F2F2',
+    'border': 1,
+    'align': 'right',
+    'valign': 'vcenter',
+    'num_format': '0'
+})
+
+_TOTAL_STYLE = MappingProxyType({
+    'bold': True,
+    'bg_color': '#4472C4',
+    'font_color': 'white',
+    'border': 2,
+    'align': 'right',
+    'valign': 'vcenter',
+    'num_format': '0'
+})
+
+_ISSUES_HEADER_STYLE = MappingProxyType({
+    'bold': True,
+    'bg_color': '#FFD966',
+    'font_color': 'black',
+    'border': 1,
+    'align': 'left',
+    'valign': 'vcenter'
+})
+
+_ISSUES_STYLE = MappingProxyType({
+    'border': 1,
+    'align': 'left',
+    'valign': 'top',
+    'text_wrap': True,
+    'bg_color': '#FFF9E6'
+})
+
+# Precomputed format cache keys for the constants above, looked up by
+# identity; the constants live for the whole process so ids are never reused
+_STYLE_KEYS: Dict[int, frozenset] = {
+    id(style): frozenset(style.items())
+    for style in (
+        _HEADER_STYLE, _TASK_HEADER_STYLE, _CRITERION_STYLE, _SCORE_STYLE,
+        _ERROR_SCORE_STYLE, _SUBTOTAL_STYLE, _TOTAL_STYLE,
+        _ISSUES_HEADER_STYLE, _ISSUES_STYLE
+    )
+}
+
 
 class ExcelFormatter:
     """
@@ -20,152 +139,94 @@ class ExcelFormatter:
     """
     
     @staticmethod
-    def get_header_style() -> Dict[str, Any]:
+    def get_header_style() -> Mapping[str, Any]:
         """
         Get the style for header rows.
         
         Returns:
-            Dictionary with style properties for headers
+            Read-only mapping of style properties for headers
         """
-        return {
-            'bold': True,
-            'bg_color': '#4472C4',
-            'font_color': 'white',
-            'border': 1,
-            'align': 'center',
-            'valign': 'vcenter'
-        }
+        return _HEADER_STYLE
     
     @staticmethod
-    def get_task_header_style() -> Dict[str, Any]:
+    def get_task_header_style() -> Mapping[str, Any]:
         """
         Get the style for task section headers.
         
         Returns:
-            Dictionary with style properties for task headers
+            Read-only mapping of style properties for task headers
         """
-        return {
-            'bold': True,
-            'bg_color': '#D9E2F3',
-            'font_color': 'black',
-            'border': 1,
-            'align': 'left',
-            'valign': 'vcenter'
-        }
+        return _TASK_HEADER_STYLE
     
     @staticmethod
-    def get_criterion_style() -> Dict[str, Any]:
+    def get_criterion_style() -> Mapping[str, Any]:
         """
         Get the style for criterion rows.
         
         Returns:
-            Dictionary with style properties for criteria
+            Read-only mapping of style properties for criteria
         """
-        return {
-            'border': 1,
-            'align': 'left',
-            'valign': 'top',
-            'text_wrap': True
-        }
+        return _CRITERION_STYLE
     
     @staticmethod
-    def get_score_style() -> Dict[str, Any]:
+    def get_score_style() -> Mapping[str, Any]:
         """
         Get the style for score cells.
         
         Returns:
-            Dictionary with style properties for scores
+            Read-only mapping of style properties for scores
         """
-        return {
-            'border': 1,
-            'align': 'center',
-            'valign': 'vcenter',
-            'num_format': '0'
-        }
+        return _SCORE_STYLE
     
     @staticmethod
-    def get_error_score_style() -> Dict[str, Any]:
+    def get_error_score_style() -> Mapping[str, Any]:
         """
         Get the style for error score cells.
         
         Returns:
-            Dictionary with style properties for error scores
+            Read-only mapping of style properties for error scores
         """
-        return {
-            'border': 1,
-            'align': 'center',
-            'valign': 'vcenter',
-            'bg_color': '#FFE6E6',
-            'font_color': '#D00000'
-        }
+        return _ERROR_SCORE_STYLE
     
     @staticmethod
-    def get_subtotal_style() -> Dict[str, Any]:
+    def get_subtotal_style() -> Mapping[str, Any]:
         """
         Get the style for subtotal rows.
         
         Returns:
-            Dictionary with style properties for subtotals
+            Read-only mapping of style properties for subtotals
         """
-        return {
-            'bold': True,
-            'bg_color': '#F2F2F2',
-            'border': 1,
-            'align': 'right',
-            'valign': 'vcenter',
-            'num_format': '0'
-        }
+        return _SUBTOTAL_STYLE
     
     @staticmethod
-    def get_total_style() -> Dict[str, Any]:
+    def get_total_style() -> Mapping[str, Any]:
         """
         Get the style for grand total row.
         
         Returns:
-            Dictionary with style properties for grand total
+            Read-only mapping of style properties for grand total
         """
-        return {
-            'bold': True,
-            'bg_color': '#4472C4',
-            'font_color': 'white',
-            'border': 2,
-            'align': 'right',
-            'valign': 'vcenter',
-            'num_format': '0'
-        }
+        return _TOTAL_STYLE
     
     @staticmethod
-    def get_issues_header_style() -> Dict[str, Any]:
+    def get_issues_header_style() -> Mapping[str, Any]:
         """
         Get the style for issues section header.
         
         Returns:
-            Dictionary with style properties for issues header
+            Read-only mapping of style properties for issues header
         """
-        return {
-            'bold': True,
-            'bg_color': '#FFD966',
-            'font_color': 'black',
-            'border': 1,
-            'align': 'left',
-            'valign': 'vcenter'
-        }
+        return _ISSUES_HEADER_STYLE
     
     @staticmethod
-    def get_issues_style() -> Dict[str, Any]:
+    def get_issues_style() -> Mapping[str, Any]:
         """
         Get the style for issues text.
         
         Returns:
-            Dictionary with style properties for issues
+            Read-only mapping of style properties for issues
         """
-        return {
-            'border': 1,
-            'align': 'left',
-            'valign': 'top',
-            'text_wrap': True,
-            'bg_color': '#FFF9E6'
-        }
+        return _ISSUES_STYLE
     
     @staticmethod
     def get_column_widths() -> Dict[str, float]:
@@ -206,10 +267,14 @@ class ExcelFormatter:
         logger.debug("Applied general worksheet formatting")
     
     @staticmethod
-    def create_format(workbook, style_dict: Dict[str, Any]):
+    def create_format(workbook, style_dict: Mapping[str, Any]):
         """
         Create an xlsxwriter format object from a style dictionary.
         
+        Identical styles requested for the same workbook return the same
+        format object instead of adding a duplicate format record. The
+        built-in styles use precomputed cache keys.
+        
         Args:
             workbook: The xlsxwriter workbook object
             style_dict: Dictionary with style properties
@@ -217,13 +282,28 @@ class ExcelFormatter:
         Returns:
             xlsxwriter format object
         """
+        workbook_formats = _format_cache.get(workbook)
+        if workbook_formats is None:
+            workbook_formats = {}
+            _format_cache[workbook] = workbook_formats
+        
+        style_key = _STYLE_KEYS.get(id(style_dict))
+        if style_key is None:
+            style_key = frozenset(style_dict.items())
+        format_obj = workbook_formats.get(style_key)
+        if format_obj is not None:
+            return format_obj
+        
         format_obj = workbook.add_format()
+        setters = _get_setter_table(type(format_obj))
         
         # Apply each style property
         for prop, value in style_dict.items():
-            if hasattr(format_obj, f'set_{prop}'):
-                getattr(format_obj, f'set_{prop}')(value)
+            setter = setters.get(prop)
+            if setter is not None:
+                setter(format_obj, value)
         
+        workbook_formats[style_key] = format_obj
         return format_obj
     
     @staticmethod
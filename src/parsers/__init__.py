@@ -6,6 +6,6 @@ This module provides parsers for:
 - Rubric files: Parse marking criteria and point allocations
 """
 
-from .notebook_parser import NotebookParser
+from .notebook_parser import NotebookParser, parse_many
 
-__all__ = ['NotebookParser']
+__all__ = ['NotebookParser', 'parse_many']
@@ -6,11 +6,35 @@ It handles both standard "#### Your Solution" and alternative "# Your Solution:"
 """
 
 import json
+import mmap
+import os
 import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
+from types import MappingProxyType
+from typing import Callable, Dict, Iterator, List, Mapping, Optional, Tuple, Any, Union
 import logging
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _JSON_LOADS_ACCEPTS_BUFFERS = True
+except ImportError:
+    _json_loads = json.loads
+    # json.loads only takes str or bytes, not memory-mapped buffers
+    _JSON_LOADS_ACCEPTS_BUFFERS = False
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -19,6 +43,23 @@ class NotebookParsingError(Exception):
     pass
 
 
+if msgspec is not None:
+    class _Cell(msgspec.Struct):
+        """Typed notebook cell holding only the fields the parser reads."""
+        cell_type: str = ""
+        source: Union[str, List[str]] = []
+        
+        def get(self, key: str, default: Any = None) -> Any:
+            """Dict-style access so typed and plain cells are interchangeable."""
+            return getattr(self, key, default)
+    
+    class _Notebook(msgspec.Struct):
+        """Typed notebook; outputs and metadata are skipped during decoding."""
+        cells: List[_Cell]
+    
+    _notebook_decoder = msgspec.json.Decoder(_Notebook)
+
+
 class NotebookParser:
     """
     Parser for extracting programming tasks from Jupyter notebooks.
@@ -28,13 +69,53 @@ class NotebookParser:
     and provides comprehensive error handling.
     """
     
+    # No per-instance __dict__; batch runs keep many parsers alive at once
+    __slots__ = (
+        'notebook_path', 'notebook_data', 'tasks', 'issues',
+        '_parsed', '_has_all_tasks'
+    )
+    
     # Standard solution markers found in notebooks
-    PRIMARY_MARKER = "#### Your Solution"
-    SECONDARY_MARKER = "# Your Solution:"
+    PRIMARY_MARKER = sys.intern("#### Your Solution")
+    SECONDARY_MARKER = sys.intern("# Your Solution:")
+    
+    # Cell types compared for every cell; interned so equal ids short-circuit ==
+    _CELL_TYPE_CODE = sys.intern("code")
+    _CELL_TYPE_MARKDOWN = sys.intern("markdown")
+    
+    # Single-pass scan for either marker
+    _MARKER_RE = re.compile(f"{re.escape(PRIMARY_MARKER)}|{re.escape(SECONDARY_MARKER)}")
     
     # Expected number of tasks per assignment
     EXPECTED_TASK_COUNT = 6
     
+    # Function each task is expected to define, used to validate task mapping
+    _EXPECTED_FUNCTIONS = {
+        2: 'bot_whisper',
+        3: 'bot_multiply', 
+        4: 'bot_count',
+        5: 'bot_topic',
+        6: 'dispatch_bot_command', 
+        7: 'chatbot_interaction'
+    }
+    _EXPECTED_DEF_NEEDLES = {
+        task: f'def {func}(' for task, func in _EXPECTED_FUNCTIONS.items()
+    }
+    
+    # Lines that only hold placeholder content rather than a real solution
+    _PLACEHOLDER_RE = re.compile(
+        r'^\s*(?:#.*your.*solution.*here.*|pass|\.\.\.|#\s*TODO)\s*$',
+        re.IGNORECASE
+    )
+    
+    # Notebooks larger than this are stream-parsed (when ijson is installed)
+    # so that cell outputs are never materialized
+    STREAMING_THRESHOLD_BYTES = 256 * 1024
+    
+    # Notebooks larger than this are decoded straight from a memory map
+    # instead of being copied into a bytes object first
+    MMAP_THRESHOLD_BYTES = 1024 * 1024
+    
     def __init__(self, notebook_path: str):
         """
         Initialize the parser with a notebook file path.
@@ -49,6 +130,8 @@ class NotebookParser:
         self.notebook_data = None
         self.tasks = {}
         self.issues = []
+        self._parsed = False
+        self._has_all_tasks = False
         
         if not self.notebook_path.exists():
             raise NotebookParsingError(f"Notebook file not found: {notebook_path}")
@@ -62,9 +145,17 @@ class NotebookParser:
         Raises:
             NotebookParsingError: If JSON is corrupted or invalid
         """
+        if msgspec is not None and self._load_notebook_typed():
+            return
+        
+        if (ijson is not None and
+                self.notebook_path.stat().st_size > self.STREAMING_THRESHOLD_BYTES and
+                self._load_notebook_streaming()):
+            return
+        
         try:
-            with open(self.notebook_path, 'r', encoding='utf-8') as f:
-                self.notebook_data = json.load(f)
+            # orjson decodes bytes directly; json.loads accepts UTF-8 bytes too
+            self.notebook_data = self._decode_file(_json_loads, _JSON_LOADS_ACCEPTS_BUFFERS)
             
             # Validate basic notebook structure
             if not isinstance(self.notebook_data, dict):
@@ -79,10 +170,91 @@ class NotebookParser:
             logger.info(f"Successfully loaded notebook with {len(self.notebook_data['cells'])} cells")
             
         except json.JSONDecodeError as e:
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError
             raise NotebookParsingError(f"Corrupted JSON in notebook: {e}")
         except Exception as e:
             raise NotebookParsingError(f"Error loading notebook: {e}")
     
+    def _decode_file(self, decode: Callable[[Any], Any], accepts_buffers: bool = True) -> Any:
+        """
+        Decode the notebook file, memory-mapping it when it is large.
+        
+        Args:
+            decode: Decoder taking the raw file contents
+            accepts_buffers: Whether the decoder accepts any buffer, not just bytes
+            
+        Returns:
+            The decoded notebook
+        """
+        if not accepts_buffers or self.notebook_path.stat().st_size <= self.MMAP_THRESHOLD_BYTES:
+            return decode(self.notebook_path.read_bytes())
+        
+        with open(self.notebook_path, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                # Release the view before the map closes
+                with memoryview(mm) as view:
+                    return decode(view)
+    
+    def _load_notebook_typed(self) -> bool:
+        """
+        Decode the notebook straight into typed cell structs with msgspec.
+        
+        Only each cell's type and source are materialised. Notebooks that do
+        not match the expected schema are left to the regular loader so it
+        can report the structural problem.
+        
+        Returns:
+            True if the notebook was loaded, False to fall back to a full load
+            
+        Raises:
+            NotebookParsingError: If JSON is corrupted or the file is unreadable
+        """
+        try:
+            notebook = self._decode_file(_notebook_decoder.decode)
+        except msgspec.ValidationError:
+            return False
+        except msgspec.DecodeError as e:
+            raise NotebookParsingError(f"Corrupted JSON in notebook: {e}")
+        except Exception as e:
+            raise NotebookParsingError(f"Error loading notebook: {e}")
+        
+        self.notebook_data = {'cells': notebook.cells}
+        logger.info(f"Successfully loaded notebook with {len(notebook.cells)} cells")
+        return True
+    
+    def _load_notebook_streaming(self) -> bool:
+        """
+        Stream the notebook's cells, keeping only their type and source.
+        
+        Outputs, execution counts and metadata are discarded as each cell is
+        read. Notebooks without a non-empty 'cells' list are left to the
+        regular loader so it can report the structural problem.
+        
+        Returns:
+            True if the notebook was loaded, False to fall back to a full load
+            
+        Raises:
+            NotebookParsingError: If JSON is corrupted or invalid
+        """
+        try:
+            with open(self.notebook_path, 'rb') as f:
+                cells = [
+                    {'cell_type': cell.get('cell_type'), 'source': cell.get('source', [])}
+                    for cell in ijson.items(f, 'cells.item')
+                    if isinstance(cell, dict)
+                ]
+        except ijson.JSONError as e:
+            raise NotebookParsingError(f"Corrupted JSON in notebook: {e}")
+        except Exception as e:
+            raise NotebookParsingError(f"Error loading notebook: {e}")
+        
+        if not cells:
+            return False
+        
+        self.notebook_data = {'cells': cells}
+        logger.info(f"Successfully stream-loaded notebook with {len(cells)} cells")
+        return True
+    
     def _is_solution_marker(self, cell_source: str) -> bool:
         """
         Check if a cell contains a solution marker.
@@ -93,8 +265,27 @@ class NotebookParser:
         Returns:
             True if cell contains either primary or secondary marker
         """
-        return (self.PRIMARY_MARKER in cell_source or 
-                self.SECONDARY_MARKER in cell_source)
+        return self._MARKER_RE.search(cell_source) is not None
+    
+    def _source_has_marker(self, source: Any) -> bool:
+        """
+        Check if a cell's source contains a solution marker.
+        
+        List sources are scanned line by line, stopping at the first match,
+        instead of being joined into one string first. Notebook source lines
+        never span a marker, so this matches scanning the joined text.
+        
+        Args:
+            source: Cell source as a list of lines or a string
+            
+        Returns:
+            True if any part of the source contains a marker
+        """
+        if isinstance(source, list):
+            search = self._MARKER_RE.search
+            return any(search(fragment) for fragment in source)
+        
+        return self._is_solution_marker(str(source))
     
     def _extract_code_from_cell(self, cell: Dict[str, Any]) -> str:
         """
@@ -106,11 +297,16 @@ class NotebookParser:
         Returns:
             The code content as a string
         """
-        if cell.get('cell_type') != 'code':
+        if cell.get('cell_type') != self._CELL_TYPE_CODE:
             return ""
         
         source = cell.get('source', [])
         if isinstance(source, list):
+            if not source:
+                return ""
+            # One-line cells are common; skip building a joined copy
+            if len(source) == 1:
+                return source[0].strip()
             return ''.join(source).strip()
         elif isinstance(source, str):
             return source.strip()
@@ -137,21 +333,15 @@ class NotebookParser:
         # Use sequential mapping as primary method since notebooks are ordered
         # Only use function identification as validation/debugging
         if task_number <= 7:
-            # Add validation by checking for expected function
-            expected_functions = {
-                2: 'bot_whisper',
-                3: 'bot_multiply', 
-                4: 'bot_count',
-                5: 'bot_topic',
-                6: 'dispatch_bot_command', 
-                7: 'chatbot_interaction'
-            }
-            
-            expected_func = expected_functions.get(task_number)
-            if expected_func and f'def {expected_func}(' in code_content:
-                logger.debug(f"Sequential mapping validated: task_index {task_index} -> task {task_number} (found {expected_func})")
-            else:
-                logger.debug(f"Sequential mapping: task_index {task_index} -> task {task_number} (expected {expected_func})")
+            # Validation by checking for the expected function is only logged,
+            # so skip it entirely unless debug logging is enabled
+            if logger.isEnabledFor(logging.DEBUG):
+                expected_func = self._EXPECTED_FUNCTIONS.get(task_number)
+                needle = self._EXPECTED_DEF_NEEDLES.get(task_number)
+                if needle and needle in code_content:
+                    logger.debug(f"Sequential mapping validated: task_index {task_index} -> task {task_number} (found {expected_func})")
+                else:
+                    logger.debug(f"Sequential mapping: task_index {task_index} -> task {task_number} (expected {expected_func})")
             
             return task_number
         else:
@@ -171,21 +361,18 @@ class NotebookParser:
         if not code_content.strip():
             return False, "EMPTY_CODE"
         
-        # Check for common placeholder patterns
-        placeholder_patterns = [
-            r'^\s*#.*your.*solution.*here.*$',
-            r'^\s*pass\s*$',
-            r'^\s*\.\.\.\s*$',
-            r'^\s*#\s*TODO\s*$'
-        ]
-        
-        lines = [line.strip() for line in code_content.split('\n') if line.strip()]
+        # Only short snippets can be placeholders, so stop at the third line
+        lines = []
+        for raw_line in code_content.splitlines():
+            line = raw_line.strip()
+            if line:
+                if len(lines) == 2:
+                    return True, None
+                lines.append(line)
         
         # If only placeholder content
-        if len(lines) <= 2:
-            for pattern in placeholder_patterns:
-                if any(re.match(pattern, line, re.IGNORECASE) for line in lines):
-                    return False, "PLACEHOLDER_CODE"
+        if any(self._PLACEHOLDER_RE.match(line) for line in lines):
+            return False, "PLACEHOLDER_CODE"
         
         return True, None
     
@@ -202,84 +389,162 @@ class NotebookParser:
         if not self.notebook_data:
             raise NotebookParsingError("Notebook not loaded")
         
-        cells = self.notebook_data['cells']
-        task_index = 0
-        found_tasks = {}
+        for _ in self._scan_tasks():
+            pass
         
-        logger.info(f"Parsing notebook with {len(cells)} cells")
+        return self.tasks
+    
+    def iter_tasks(self) -> Iterator[Tuple[int, str]]:
+        """
+        Yield task solutions as they are found in the notebook.
         
-        for i, cell in enumerate(cells):
-            # Skip non-markdown cells for markers
-            if cell.get('cell_type') != 'markdown':
-                continue
-            
-            # Check if this cell contains a solution marker
-            source = cell.get('source', [])
-            if isinstance(source, list):
-                cell_text = ''.join(source)
-            else:
-                cell_text = str(source)
-            
-            if not self._is_solution_marker(cell_text):
-                continue
-            
-            logger.debug(f"Found solution marker in cell {i}")
-            
-            # Look for the next code cell
-            code_content = ""
-            code_cell_found = False
-            
-            for j in range(i + 1, min(i + 3, len(cells))):  # Look ahead up to 2 cells
-                next_cell = cells[j]
-                if next_cell.get('cell_type') == 'code':
-                    code_content = self._extract_code_from_cell(next_cell)
-                    code_cell_found = True
-                    logger.debug(f"Found code in cell {j} with {len(code_content)} characters")
-                    break
-            
-            if not code_cell_found:
-                issue = f"No code cell found after solution marker in cell {i}"
-                self.issues.append(issue)
-                logger.warning(issue)
-                continue
+        Callers can start working on early tasks before the rest of the
+        notebook is scanned. Parse results are stored once the generator is
+        exhausted; after that, the stored tasks that have code are replayed.
+        
+        Yields:
+            Tuples of (task_number, code_content)
             
-            # Determine task number
-            task_number = self._identify_task_number(task_index, code_content)
-            logger.debug(f"Task {task_index} assigned to task number {task_number}")
+        Raises:
+            NotebookParsingError: If parsing fails
+        """
+        if self._parsed:
+            yield from ((num, code) for num, code in self.tasks.items() if code)
+            return
+        
+        if not self.notebook_data:
+            raise NotebookParsingError("Notebook not loaded")
+        
+        yield from self._scan_tasks()
+    
+    def _scan_tasks(self) -> Iterator[Tuple[int, str]]:
+        """
+        Scan the notebook, yielding each task and storing results at the end.
+        
+        Yields:
+            Tuples of (task_number, code_content)
+        """
+        # Pre-seed tasks 2-7 in order so no sort is needed afterwards;
+        # task numbers are always mapped into this range
+        found_tasks = dict.fromkeys(range(2, 8), "")
+        found_numbers = set()
+        
+        logger.info(f"Parsing notebook with {len(self.notebook_data['cells'])} cells")
+        
+        for task_number, code_content in self._iter_task_pairs():
+            found_tasks[task_number] = code_content
+            found_numbers.add(task_number)
+            yield task_number, code_content
+        
+        self._finish_parse(found_tasks, found_numbers)
+    
+    def _iter_task_pairs(self) -> Iterator[Tuple[int, str]]:
+        """
+        Pair each solution marker with the code cell that follows it.
+        
+        Yields:
+            Tuples of (task_number, code_content) in notebook order
+        """
+        task_index = 0
+        seen_numbers = set()
+        
+        # Marker cells still waiting for a code cell within the next 2 cells
+        pending_markers = []
+        
+        for i, cell in enumerate(self.notebook_data['cells']):
+            cell_type = cell.get('cell_type')
             
-            # Check for duplicate task numbers
-            if task_number in found_tasks:
-                logger.warning(f"Duplicate task number {task_number} found - overwriting previous")
+            # Markers whose look-ahead window has passed have no code cell
+            while pending_markers and i - pending_markers[0] > 2:
+                self._report_missing_code(pending_markers.pop(0))
             
-            # Validate code content
-            is_valid, issue = self._validate_code_content(code_content)
-            if not is_valid:
-                self.issues.append(f"Task {task_number}: {issue}")
-                logger.warning(f"Task {task_number} has issue: {issue}")
+            if cell_type == self._CELL_TYPE_CODE:
+                if not pending_markers:
+                    continue
+                
+                code_content = self._extract_code_from_cell(cell)
+                logger.debug(f"Found code in cell {i} with {len(code_content)} characters")
+                
+                for _ in pending_markers:
+                    task_number = self._record_task(seen_numbers, task_index, code_content)
+                    task_index += 1
+                    yield task_number, code_content
+                pending_markers.clear()
             
-            found_tasks[task_number] = code_content
-            task_index += 1
+            # Check if this markdown cell contains a solution marker
+            elif cell_type == self._CELL_TYPE_MARKDOWN and self._source_has_marker(cell.get('source', [])):
+                logger.debug(f"Found solution marker in cell {i}")
+                pending_markers.append(i)
+        
+        for marker_index in pending_markers:
+            self._report_missing_code(marker_index)
+    
+    def _finish_parse(self, found_tasks: Dict[int, str], found_numbers: set) -> None:
+        """
+        Report missing tasks and store the parse results.
         
+        Args:
+            found_tasks: Tasks 2-7 mapped to their code ("" when missing)
+            found_numbers: Task numbers that were found in the notebook
+        """
         # Validate expected task count
-        if len(found_tasks) < self.EXPECTED_TASK_COUNT:
-            issue = f"Expected {self.EXPECTED_TASK_COUNT} tasks, found {len(found_tasks)}"
+        if len(found_numbers) < self.EXPECTED_TASK_COUNT:
+            issue = f"Expected {self.EXPECTED_TASK_COUNT} tasks, found {len(found_numbers)}"
             self.issues.append(issue)
             logger.warning(issue)
         
-        # Ensure all expected tasks are present (2-7)
-        for expected_task in range(2, 8):
-            if expected_task not in found_tasks:
-                found_tasks[expected_task] = ""
+        # Report expected tasks (2-7) that were never found
+        for expected_task in found_tasks:
+            if expected_task not in found_numbers:
                 self.issues.append(f"Task {expected_task}: MISSING_TASK")
                 logger.warning(f"Task {expected_task} is missing")
         
-        # Sort the found tasks to ensure consistent ordering
-        found_tasks = dict(sorted(found_tasks.items()))
-        
         self.tasks = found_tasks
+        self._has_all_tasks = all(
+            self.tasks.get(task_num, "").strip() for task_num in range(2, 8)
+        )
+        self._parsed = True
         logger.info(f"Successfully parsed {len([t for t in found_tasks.values() if t])} tasks with code")
+    
+    def _report_missing_code(self, marker_index: int) -> None:
+        """
+        Record that no code cell followed a solution marker.
         
-        return found_tasks
+        Args:
+            marker_index: Index of the marker cell
+        """
+        issue = f"No code cell found after solution marker in cell {marker_index}"
+        self.issues.append(issue)
+        logger.warning(issue)
+    
+    def _record_task(self, seen_numbers: set, task_index: int, code_content: str) -> int:
+        """
+        Assign code to the next task number and validate it.
+        
+        Args:
+            seen_numbers: Task numbers assigned so far, updated in place
+            task_index: Sequential index of this task (0-based)
+            code_content: Code extracted for the task
+            
+        Returns:
+            The task number the code was assigned to
+        """
+        # Determine task number
+        task_number = self._identify_task_number(task_index, code_content)
+        logger.debug(f"Task {task_index} assigned to task number {task_number}")
+        
+        # Check for duplicate task numbers
+        if task_number in seen_numbers:
+            logger.warning(f"Duplicate task number {task_number} found - overwriting previous")
+        
+        # Validate code content
+        is_valid, issue = self._validate_code_content(code_content)
+        if not is_valid:
+            self.issues.append(f"Task {task_number}: {issue}")
+            logger.warning(f"Task {task_number} has issue: {issue}")
+        
+        seen_numbers.add(task_number)
+        return task_number
     
     def get_task_code(self, task_number: int) -> Optional[str]:
         """
@@ -291,22 +556,22 @@ class NotebookParser:
         Returns:
             The code content or None if task not found
         """
-        if not self.tasks:
+        if not self._parsed:
             self.parse_tasks()
         
         return self.tasks.get(task_number)
     
-    def get_all_tasks(self) -> Dict[int, str]:
+    def get_all_tasks(self) -> Mapping[int, str]:
         """
         Get all parsed tasks.
         
         Returns:
-            Dictionary mapping task numbers to code content
+            Read-only mapping of task numbers to code content
         """
-        if not self.tasks:
+        if not self._parsed:
             self.parse_tasks()
         
-        return self.tasks.copy()
+        return MappingProxyType(self.tasks)
     
     def get_issues(self) -> List[str]:
         """
@@ -324,14 +589,10 @@ class NotebookParser:
         Returns:
             True if all 6 tasks (2-7) have non-empty code
         """
-        if not self.tasks:
+        if not self._parsed:
             self.parse_tasks()
         
-        for task_num in range(2, 8):
-            if task_num not in self.tasks or not self.tasks[task_num].strip():
-                return False
-        
-        return True
+        return self._has_all_tasks
     
     def get_summary(self) -> Dict[str, Any]:
         """
@@ -340,7 +601,7 @@ class NotebookParser:
         Returns:
             Dictionary with parsing statistics and issues
         """
-        if not self.tasks:
+        if not self._parsed:
             self.parse_tasks()
         
         tasks_with_code = sum(1 for code in self.tasks.values() if code.strip())
@@ -355,3 +616,54 @@ class NotebookParser:
             'issues_count': len(self.issues),
             'issues': self.issues
         }
+
+
+def _parse_one(path: str) -> Tuple[str, Dict[int, str], List[str]]:
+    """
+    Parse one notebook in a worker process.
+    
+    Args:
+        path: Path to the notebook file
+        
+    Returns:
+        Tuple of (path, tasks, issues) for the notebook
+    """
+    parser = NotebookParser(path)
+    # The read-only task view cannot be pickled back to the parent process
+    return path, dict(parser.get_all_tasks()), parser.get_issues()
+
+
+def parse_many(
+    paths: List[str],
+    workers: Optional[int] = None
+) -> Dict[str, Tuple[Dict[int, str], List[str]]]:
+    """
+    Parse many notebooks in parallel processes.
+    
+    Each notebook is independent and parsing is CPU-bound in JSON decoding
+    and regex scanning, so the files are spread across a process pool.
+    
+    Args:
+        paths: Paths to the notebook files
+        workers: Number of worker processes (defaults to the CPU count)
+        
+    Returns:
+        Dictionary mapping each path to its (tasks, issues), in input order
+        
+    Raises:
+        NotebookParsingError: If any notebook cannot be loaded
+    """
+    if not paths:
+        return {}
+    
+    paths = [str(path) for path in paths]
+    workers = min(workers or os.cpu_count() or 1, len(paths))
+    
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = {
+            path: (tasks, issues)
+            for path, tasks, issues in executor.map(_parse_one, paths, chunksize=8)
+        }
+    
+    logger.info(f"Parsed {len(results)} notebooks using {workers} workers")
+    return results
@@ -5,20 +5,104 @@ This module parses CSV rubric files to extract marking criteria for each task,
 including task names, criterion descriptions, and maximum points per criterion.
 """
 
+import functools
+import numpy as np
 import pandas as pd
 import re
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple, Any
 import logging
+from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
+# Task header and subtotal patterns, compiled once for every row check
+_TASK_RE = re.compile(r'Task\s+(\d+)', re.IGNORECASE)
+_SUBTOTAL_RE = re.compile(r'SUBTOTAL', re.IGNORECASE)
+
+
+def _is_missing(value: Any) -> bool:
+    """
+    Check whether a cell value is missing (None, empty or NaN).
+    
+    Args:
+        value: Raw cell value
+        
+    Returns:
+        True if the value holds no data
+    """
+    # NaN is the only value that is not equal to itself
+    return not value or value != value
+
+
+@functools.lru_cache(maxsize=256)
+def _task_number_from_text(task_text: str) -> Optional[int]:
+    """
+    Extract a task number (2-7) from task text, memoized per distinct text.
+    
+    Args:
+        task_text: Text containing task information
+        
+    Returns:
+        Task number (2-7) or None if not found
+    """
+    # Look for "Task X" pattern
+    match = _TASK_RE.search(task_text)
+    if match:
+        task_num = int(match.group(1))
+        if 2 <= task_num <= 7:
+            return task_num
+    
+    return None
+
 
 class RubricParsingError(Exception):
     """Custom exception for rubric parsing errors."""
     pass
 
 
+@dataclass(frozen=True)
+class Criterion:
+    """
+    A single marking criterion parsed from the rubric.
+    
+    Supports read-only dict-style access (criterion['max_points']) so code
+    written against the earlier dict criteria keeps working.
+    """
+    __slots__ = ('task_number', 'criterion', 'max_points', 'row_index')
+    
+    task_number: int
+    criterion: str
+    max_points: int
+    row_index: int
+    
+    def __getitem__(self, key: str) -> Any:
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+    
+    def __contains__(self, key: object) -> bool:
+        return key in self.__slots__
+    
+    def __reduce__(self):
+        # Frozen slotted instances cannot be restored through setattr
+        return (Criterion, (self.task_number, self.criterion, self.max_points, self.row_index))
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return a field value, or default if there is no such field."""
+        return getattr(self, key) if key in self.__slots__ else default
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the criterion as a plain dictionary."""
+        return {
+            'task_number': self.task_number,
+            'criterion': self.criterion,
+            'max_points': self.max_points,
+            'row_index': self.row_index
+        }
+
+
 class RubricParser:
     """
     Parser for extracting marking criteria from CSV rubric files.
@@ -42,7 +126,7 @@ class RubricParser:
     
     def __init__(self, rubric_path: str):
         """
-        Initialize the parser with a rubric CSV file path.
+        Initialize the parser with a rubric CSV file path and parse it.
         
         Args:
             rubric_path: Path to the CSV rubric file
@@ -53,12 +137,19 @@ class RubricParser:
         self.rubric_path = Path(rubric_path)
         self.rubric_data = None
         self.tasks = {}
+        self._tasks_view: Mapping[int, List[Criterion]] = MappingProxyType(self.tasks)
         self.issues = []
+        self._parsed = False
+        self._has_critical_issue = False
+        self._task_max_points: Dict[int, int] = {}
+        self._total_max_points = 0
         
         if not self.rubric_path.exists():
             raise RubricParsingError(f"Rubric file not found: {rubric_path}")
         
         self._load_rubric()
+        # Rubrics are small, so parse up front and keep the getters branch-free
+        self.parse_rubric()
     
     def _load_rubric(self) -> None:
         """
@@ -69,8 +160,7 @@ class RubricParser:
         """
         try:
             # Load CSV with pandas, handling potential encoding issues including BOM
-            self.rubric_data = pd.read_csv(
-                self.rubric_path, 
+            read_options = dict(
                 header=None,
                 names=['task', 'criterion', 'score', 'max_points'],
                 dtype={
@@ -83,6 +173,15 @@ class RubricParser:
                 encoding='utf-8-sig'  # Handle BOM
             )
             
+            try:
+                # The pyarrow reader is faster when installed; it rejects some
+                # inputs (e.g. ragged rows) that the C engine accepts
+                self.rubric_data = pd.read_csv(
+                    self.rubric_path, engine='pyarrow', dtype_backend='pyarrow', **read_options
+                )
+            except (ImportError, ValueError):
+                self.rubric_data = pd.read_csv(self.rubric_path, **read_options)
+            
             # Check if file is effectively empty after loading
             if len(self.rubric_data) == 0:
                 raise RubricParsingError("Rubric CSV file is empty")
@@ -108,21 +207,17 @@ class RubricParser:
         Returns:
             Task number (2-7) or None if not found
         """
-        if not task_text or pd.isna(task_text):
+        if _is_missing(task_text):
             return None
         
-        # Look for "Task X" pattern
-        match = re.search(r'Task\s+(\d+)', str(task_text), re.IGNORECASE)
-        if match:
-            task_num = int(match.group(1))
-            if 2 <= task_num <= 7:
-                return task_num
-        
-        return None
+        return _task_number_from_text(str(task_text))
     
     def _parse_max_points(self, points_text: str) -> Optional[int]:
         """
-        Parse maximum points from text.
+        Parse maximum points from a single cell.
+        
+        parse_rubric converts the whole column at once; this is the
+        per-value equivalent and follows the same rules.
         
         Args:
             points_text: Text containing point value
@@ -130,7 +225,7 @@ class RubricParser:
         Returns:
             Point value as integer or None if invalid
         """
-        if not points_text or pd.isna(points_text):
+        if _is_missing(points_text):
             return None
         
         # Clean the text and try to extract integer
@@ -140,101 +235,120 @@ class RubricParser:
         
         try:
             return int(float(clean_text))
-        except (ValueError, TypeError):
+        except (ValueError, TypeError, OverflowError):
+            # OverflowError: 'inf' has no integer value
             return None
     
-    def _is_subtotal_row(self, row: pd.Series) -> bool:
+    def _is_subtotal_row(self, row: Any) -> bool:
         """
         Check if a row represents a subtotal.
         
         Args:
-            row: DataFrame row
+            row: DataFrame row (Series or itertuples namedtuple)
             
         Returns:
             True if this is a subtotal row
         """
-        criterion_text = str(row['criterion']).strip().upper()
-        return 'SUBTOTAL' in criterion_text
+        return _SUBTOTAL_RE.search(str(row.criterion)) is not None
     
-    def _is_empty_row(self, row: pd.Series) -> bool:
+    def _is_empty_row(self, row: Any) -> bool:
         """
         Check if a row is empty or contains only whitespace.
         
         Args:
-            row: DataFrame row
+            row: DataFrame row (Series or itertuples namedtuple)
             
         Returns:
             True if row is effectively empty
         """
-        for col in ['task', 'criterion', 'max_points']:
-            if str(row[col]).strip():
-                return False
-        return True
+        return not (
+            str(row.task).strip() or
+            str(row.criterion).strip() or
+            str(row.max_points).strip()
+        )
     
-    def parse_rubric(self) -> Dict[int, List[Dict[str, Any]]]:
+    def parse_rubric(self) -> Dict[int, List[Criterion]]:
         """
         Parse the rubric CSV and extract all task criteria.
         
+        Results are cached, so repeated calls return the first parse.
+        
         Returns:
             Dictionary mapping task numbers to lists of criteria
             
         Raises:
             RubricParsingError: If parsing fails
         """
+        if self._parsed:
+            return self.tasks
+        
         if self.rubric_data is None:
             raise RubricParsingError("Rubric not loaded")
         
-        tasks = {}
-        current_task = None
-        
         logger.info(f"Parsing rubric with {len(self.rubric_data)} rows")
         
-        for idx, row in self.rubric_data.iterrows():
-            # Skip empty rows
-            if self._is_empty_row(row):
-                continue
-            
-            # Skip subtotal rows
-            if self._is_subtotal_row(row):
-                continue
-            
-            # Check if this row starts a new task
-            task_num = self._extract_task_number(row['task'])
-            if task_num is not None:
-                current_task = task_num
-                if current_task not in tasks:
-                    tasks[current_task] = []
-                logger.debug(f"Found Task {current_task}")
-            
-            # Extract criterion information
-            criterion_text = str(row['criterion']).strip()
-            max_points = self._parse_max_points(row['max_points'])
-            
-            # Skip rows without criterion text or points
-            if not criterion_text or max_points is None:
-                continue
-            
-            if current_task is None:
-                issue = f"Found criterion without task context at row {idx}: {criterion_text}"
-                self.issues.append(issue)
-                logger.warning(issue)
-                continue
-            
-            # Add criterion to current task
-            criterion = {
-                'task_number': current_task,
-                'criterion': criterion_text,
-                'max_points': max_points,
-                'row_index': idx
-            }
-            
-            tasks[current_task].append(criterion)
-            logger.debug(f"Added criterion to Task {current_task}: {criterion_text} ({max_points} pts)")
+        # Strip every column once; all row checks below reuse these values
+        stripped = self.rubric_data[['task', 'criterion', 'max_points']].astype(str).apply(
+            lambda column: column.str.strip()
+        )
+        task_text = stripped['task']
+        criterion_text = stripped['criterion']
+        points_text = stripped['max_points']
+        
+        is_empty = (stripped == '').all(axis=1)
+        is_subtotal = criterion_text.str.contains(_SUBTOTAL_RE)
+        is_content = ~(is_empty | is_subtotal)
+        
+        # Rows naming a task (2-7) start it; later rows inherit it. Task cells
+        # repeat (mostly blank), so the memoized lookup runs the regex rarely.
+        task_numbers = pd.to_numeric(
+            task_text.map(_task_number_from_text, na_action='ignore'), errors='coerce'
+        )
+        task_numbers = task_numbers.where(is_content)
+        current_task = task_numbers.ffill()
+        
+        # Decimal point values are truncated to integers
+        max_points = np.trunc(pd.to_numeric(points_text, errors='coerce'))
+        max_points = max_points.where(np.isfinite(max_points))
+        
+        is_criterion = is_content & (criterion_text != '') & max_points.notna()
+        
+        for idx, text in criterion_text[is_criterion & current_task.isna()].items():
+            issue = f"Found criterion without task context at row {idx}: {text}"
+            self.issues.append(issue)
+            logger.warning(issue)
+        
+        # Tasks appear in the order their header rows do, even without criteria
+        tasks = {int(task_num): [] for task_num in task_numbers.dropna()}
+        for task_num in tasks:
+            logger.debug(f"Found Task {task_num}")
+        
+        has_task = is_criterion & current_task.notna()
+        criteria = pd.DataFrame({
+            'task_number': current_task[has_task].astype(int),
+            'criterion': criterion_text[has_task],
+            'max_points': max_points[has_task].astype(int),
+            'row_index': self.rubric_data.index[has_task]
+        })
+        for task_num, group in criteria.groupby('task_number', sort=False):
+            # tolist() yields native ints and strs for the criterion fields
+            tasks[int(task_num)] = [
+                Criterion(*fields)
+                for fields in zip(*(group[column].tolist() for column in group.columns))
+            ]
+            logger.debug(f"Added {len(group)} criteria to Task {task_num}")
         
         # Validate task structure
         self._validate_task_structure(tasks)
         
         self.tasks = tasks
+        self._tasks_view = MappingProxyType(tasks)
+        self._task_max_points = {
+            task_num: sum(c.max_points for c in criteria)
+            for task_num, criteria in tasks.items()
+        }
+        self._total_max_points = sum(self._task_max_points.values())
+        self._parsed = True
         logger.info(f"Successfully parsed {len(tasks)} tasks with {sum(len(criteria) for criteria in tasks.values())} criteria")
         
         return tasks
@@ -251,11 +365,14 @@ class RubricParser:
             if expected_task not in tasks:
                 issue = f"Missing Task {expected_task}"
                 self.issues.append(issue)
+                self._has_critical_issue = True
                 logger.warning(issue)
         
         # Check point totals for each task
+        total_points = 0
         for task_num, criteria in tasks.items():
             actual_points = sum(criterion['max_points'] for criterion in criteria)
+            total_points += actual_points
             expected_points = self.EXPECTED_TASK_POINTS.get(task_num)
             
             if expected_points and actual_points != expected_points:
@@ -264,17 +381,13 @@ class RubricParser:
                 logger.warning(issue)
         
         # Check total points
-        total_points = sum(
-            sum(criterion['max_points'] for criterion in criteria)
-            for criteria in tasks.values()
-        )
-        
         if total_points != self.EXPECTED_TOTAL_POINTS:
             issue = f"Total points: Expected {self.EXPECTED_TOTAL_POINTS}, found {total_points}"
             self.issues.append(issue)
+            self._has_critical_issue = True
             logger.warning(issue)
     
-    def get_task_criteria(self, task_number: int) -> Optional[List[Dict[str, Any]]]:
+    def get_task_criteria(self, task_number: int) -> Optional[List[Criterion]]:
         """
         Get all criteria for a specific task.
         
@@ -282,24 +395,18 @@ class RubricParser:
             task_number: The task number (2-7)
             
         Returns:
-            List of criteria dictionaries or None if task not found
+            List of criteria or None if task not found
         """
-        if not self.tasks:
-            self.parse_rubric()
-        
         return self.tasks.get(task_number)
     
-    def get_all_tasks(self) -> Dict[int, List[Dict[str, Any]]]:
+    def get_all_tasks(self) -> Mapping[int, List[Criterion]]:
         """
         Get all parsed tasks and their criteria.
         
         Returns:
-            Dictionary mapping task numbers to criteria lists
+            Read-only mapping of task numbers to criteria lists
         """
-        if not self.tasks:
-            self.parse_rubric()
-        
-        return self.tasks.copy()
+        return self._tasks_view
     
     def get_task_max_points(self, task_number: int) -> int:
         """
@@ -311,14 +418,7 @@ class RubricParser:
         Returns:
             Maximum points for the task
         """
-        if not self.tasks:
-            self.parse_rubric()
-        
-        criteria = self.get_task_criteria(task_number)
-        if not criteria:
-            return 0
-        
-        return sum(criterion['max_points'] for criterion in criteria)
+        return self._task_max_points.get(task_number, 0)
     
     def get_total_max_points(self) -> int:
         """
@@ -327,10 +427,7 @@ class RubricParser:
         Returns:
             Total maximum points
         """
-        if not self.tasks:
-            self.parse_rubric()
-        
-        return sum(self.get_task_max_points(task) for task in self.tasks.keys())
+        return self._total_max_points
     
     def get_issues(self) -> List[str]:
         """
@@ -348,19 +445,10 @@ class RubricParser:
         Returns:
             True if rubric is valid
         """
-        if not self.tasks:
-            self.parse_rubric()
-        
-        # Check for critical issues
-        critical_keywords = ['Missing Task', 'Total points']
-        for issue in self.issues:
-            for keyword in critical_keywords:
-                if keyword in issue:
-                    return False
-        
-        return len(self.tasks) > 0
+        # Missing tasks and wrong total points are flagged as critical during validation
+        return not self._has_critical_issue and len(self.tasks) > 0
     
-    def get_criterion_by_index(self, task_number: int, criterion_index: int) -> Optional[Dict[str, Any]]:
+    def get_criterion_by_index(self, task_number: int, criterion_index: int) -> Optional[Criterion]:
         """
         Get a specific criterion by task and index.
         
@@ -369,7 +457,7 @@ class RubricParser:
             criterion_index: Index of criterion within task (0-based)
             
         Returns:
-            Criterion dictionary or None if not found
+            Criterion or None if not found
         """
         criteria = self.get_task_criteria(task_number)
         if not criteria or criterion_index >= len(criteria):
@@ -384,14 +472,11 @@ class RubricParser:
         Returns:
             Dictionary with rubric statistics and issues
         """
-        if not self.tasks:
-            self.parse_rubric()
-        
         task_summaries = {}
         for task_num, criteria in self.tasks.items():
             task_summaries[task_num] = {
                 'criteria_count': len(criteria),
-                'max_points': sum(c['max_points'] for c in criteria),
+                'max_points': self._task_max_points[task_num],
                 'expected_points': self.EXPECTED_TASK_POINTS.get(task_num, 0)
             }
         
@@ -416,9 +501,6 @@ class RubricParser:
         Returns:
             Structured rubric data suitable for marking system
         """
-        if not self.tasks:
-            self.parse_rubric()
-        
         structured = {
             'metadata': {
                 'total_points': self.get_total_max_points(),
@@ -431,13 +513,13 @@ class RubricParser:
         for task_num, criteria in self.tasks.items():
             structured['tasks'][task_num] = {
                 'task_number': task_num,
-                'max_points': sum(c['max_points'] for c in criteria),
+                'max_points': self._task_max_points[task_num],
                 'criteria_count': len(criteria),
                 'criteria': [
                     {
                         'index': idx,
-                        'description': criterion['criterion'],
-                        'max_points': criterion['max_points']
+                        'description': criterion.criterion,
+                        'max_points': criterion.max_points
                     }
                     for idx, criterion in enumerate(criteria)
                 ]
@@ -1,14 +1,42 @@
 """Configuration management for the marking tool."""
 
+import functools
 import os
+import sys
 from dataclasses import dataclass
 from pathlib import Path
+from types import MappingProxyType
 from typing import Optional
 
 import yaml
 
+# dataclass(slots=True) is only available on Python 3.10+; older interpreters
+# still get frozen instances, just with a per-instance __dict__.
+_DATACLASS_OPTIONS = {"frozen": True}
+if sys.version_info >= (3, 10):
+    _DATACLASS_OPTIONS["slots"] = True
 
-@dataclass
+# Prefer the libyaml-backed loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_yaml(path_str: str, mtime: float) -> dict:
+    """
+    Parse a YAML file, memoized on its path and modification time.
+    
+    Args:
+        path_str: Path to the YAML file
+        mtime: Modification time of the file, so edits invalidate the cache
+        
+    Returns:
+        Parsed YAML data (shared; callers must copy before mutating)
+    """
+    with open(path_str, "r") as f:
+        return yaml.load(f, Loader=_YAML_LOADER)
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class MarkingConfig:
     """Configuration for the marking tool."""
     
@@ -31,6 +59,19 @@ class MarkingConfig:
     models_dir: Optional[Path] = None
     cache_dir: Optional[Path] = None
     
+    # Environment overrides read by from_env: (field, variable, default, type)
+    _ENV_SPEC = (
+        ("temperature", "MARKING_TEMPERATURE", "0.0", float),
+        ("max_retries", "MARKING_MAX_RETRIES", "3", int),
+        ("retry_delay", "MARKING_RETRY_DELAY", "1.0", float),
+        ("batch_size", "MARKING_BATCH_SIZE", "1", int),
+        ("timeout_seconds", "MARKING_TIMEOUT", "300", int),
+    )
+    
+    def __post_init__(self):
+        """Validate configuration on construction."""
+        self.validate()
+    
     @classmethod
     def from_env(cls, model_name: str) -> "MarkingConfig":
         """
@@ -46,15 +87,13 @@ class MarkingConfig:
         if not api_key:
             raise ValueError("OPENAI_API_KEY environment variable not set")
         
-        return cls(
-            api_key=api_key,
-            model_name=model_name,
-            temperature=float(os.environ.get("MARKING_TEMPERATURE", "0.0")),
-            max_retries=int(os.environ.get("MARKING_MAX_RETRIES", "3")),
-            retry_delay=float(os.environ.get("MARKING_RETRY_DELAY", "1.0")),
-            batch_size=int(os.environ.get("MARKING_BATCH_SIZE", "1")),
-            timeout_seconds=int(os.environ.get("MARKING_TIMEOUT", "300")),
-        )
+        env = os.environ
+        overrides = {
+            field: cast(env.get(variable, default))
+            for field, variable, default, cast in cls._ENV_SPEC
+        }
+        
+        return cls(api_key=api_key, model_name=model_name, **overrides)
     
     @classmethod
     def from_file(cls, config_path: Path) -> "MarkingConfig":
@@ -67,8 +106,9 @@ class MarkingConfig:
         Returns:
             MarkingConfig instance
         """
-        with open(config_path, "r") as f:
-            data = yaml.safe_load(f)
+        config_path = Path(config_path)
+        mtime = config_path.stat().st_mtime
+        data = dict(_load_yaml(str(config_path), mtime))
         
         # Get API key from environment if not in config
         if "api_key" not in data:
@@ -103,7 +143,7 @@ class MarkingConfig:
             raise ValueError("Timeout must be at least 1 second")
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class TaskConfig:
     """Configuration for a single marking task."""
     
@@ -128,11 +168,11 @@ class TaskConfig:
 
 
 # Default task configurations based on the rubric
-DEFAULT_TASK_CONFIGS = {
+DEFAULT_TASK_CONFIGS = MappingProxyType({
     2: TaskConfig(task_number=2, max_points=8, criteria_count=5),
     3: TaskConfig(task_number=3, max_points=10, criteria_count=6),
     4: TaskConfig(task_number=4, max_points=15, criteria_count=7),
     5: TaskConfig(task_number=5, max_points=15, criteria_count=7),
     6: TaskConfig(task_number=6, max_points=15, criteria_count=6),
     7: TaskConfig(task_number=7, max_points=20, criteria_count=5),
-}
+})
@@ -5,15 +5,248 @@ This module provides common fixtures and configuration for all tests
 across the marking system components.
 """
 
-import os
-import tempfile
-import json
-import csv
+import copy
+import functools
+import re
+import shutil
+from contextlib import ExitStack
 from pathlib import Path
 from unittest.mock import Mock, patch
 
 import pytest
-import pandas as pd
+
+from tests.fixtures.json_encoding import dumps
+
+
+# Static fixture payloads, built once at import time
+_VALID_RUBRIC_ROWS = [
+    ["Task", "Criterion", "Score", "Max Points"],
+    ["Task 2", "Correctness of recursive implementation", "", "4"],
+    ["", "Proper base case handling", "", "2"],
+    ["", "Code efficiency", "", "2"],
+    ["Task 3", "Correct sorting algorithm implementation", "", "5"],
+    ["", "Proper array manipulation", "", "3"],
+    ["", "Edge case handling", "", "2"],
+    ["Task 4", "Data structure usage", "", "6"],
+    ["", "Algorithm efficiency", "", "5"],
+    ["", "Code readability", "", "4"],
+    ["Task 5", "Problem decomposition", "", "6"],
+    ["", "Function design", "", "5"],
+    ["", "Error handling", "", "4"],
+    ["Task 6", "Object-oriented design", "", "6"],
+    ["", "Encapsulation", "", "5"],
+    ["", "Code documentation", "", "4"],
+    ["Task 7", "Algorithm complexity", "", "8"],
+    ["", "Optimization techniques", "", "7"],
+    ["", "Performance analysis", "", "5"]
+]
+
+_INVALID_RUBRIC_ROWS = [
+    ["Task", "Criterion", "Score", "Max Points"],
+    ["Task 2", "Some criterion", "", "invalid_points"],  # Invalid points
+    ["", "Another criterion", "", ""],  # Missing points
+    ["Task 9", "Out of range task", "", "5"],  # Invalid task number
+    ["", "", "", "3"],  # Missing criterion
+]
+
+
+_RUBRIC_HEADER = ["Task", "Criterion", "Score", "Max Points"]
+
+
+def _csv_cell(value):
+    """Render one CSV cell, quoting only when the value requires it."""
+    text = str(value)
+    if ',' in text or '"' in text or '\n' in text:
+        return '"' + text.replace('"', '""') + '"'
+    return text
+
+
+def _to_csv_text(rows):
+    """Serialize rubric rows as CSV text."""
+    return "\n".join(",".join(map(_csv_cell, row)) for row in rows) + "\n"
+
+
+_VALID_RUBRIC_CSV = _to_csv_text(_VALID_RUBRIC_ROWS)
+_INVALID_RUBRIC_CSV = _to_csv_text(_INVALID_RUBRIC_ROWS)
+_FIXTURES_DIR_RUBRIC_CSV = _to_csv_text([
+    _RUBRIC_HEADER,
+    ["Task 2", "Test criterion", "", "5"],
+])
+
+_COMPLETE_NOTEBOOK = {
+    "metadata": {
+        "kernelspec": {
+            "display_name": "Python 3",
+            "language": "python",
+            "name": "python3"
+        }
+    },
+    "nbformat": 4,
+    "nbformat_minor": 4,
+    "cells": [
+        {
+            "cell_type": "markdown",
+            "metadata": {},
+            "source": ["# Task 2", "#### Your Solution"]
+        },
+        {
+            "cell_type": "code",
+            "execution_count": 1,
+            "metadata": {},
+            "outputs": [],
+            "source": [
+                "def fibonacci(n):",
+                "    if n <= 1:",
+                "        return n",
+                "    return fibonacci(n-1) + fibonacci(n-2)"
+            ]
+        },
+        {
+            "cell_type": "markdown",
+            "metadata": {},
+            "source": ["# Task 3", "#### Your Solution"]
+        },
+        {
+            "cell_type": "code",
+            "execution_count": 2,
+            "metadata": {},
+            "outputs": [],
+            "source": [
+                "def sort_array(arr):",
+                "    return sorted(arr)"
+            ]
+        }
+    ]
+}
+
+_MISSING_TASKS_NOTEBOOK = {
+    "metadata": {
+        "kernelspec": {
+            "display_name": "Python 3",
+            "language": "python",
+            "name": "python3"
+        }
+    },
+    "nbformat": 4,
+    "nbformat_minor": 4,
+    "cells": [
+        {
+            "cell_type": "markdown",
+            "metadata": {},
+            "source": ["# Task 2", "#### Your Solution"]
+        },
+        {
+            "cell_type": "code",
+            "execution_count": 1,
+            "metadata": {},
+            "outputs": [],
+            "source": ["print('Hello World')"]
+        }
+        # Missing other tasks
+    ]
+}
+
+_SAMPLE_NOTEBOOK_DICT = {
+    "metadata": {
+        "kernelspec": {
+            "display_name": "Python 3",
+            "language": "python",
+            "name": "python3"
+        }
+    },
+    "nbformat": 4,
+    "nbformat_minor": 4,
+    "cells": [
+        {
+            "cell_type": "markdown",
+            "metadata": {},
+            "source": ["# Task 2", "#### Your Solution"]
+        },
+        {
+            "cell_type": "code",
+            "execution_count": 1,
+            "metadata": {},
+            "outputs": [],
+            "source": [
+                "def fibonacci(n):",
+                "    if n <= 1:",
+                "        return n",
+                "    return fibonacci(n-1) + fibonacci(n-2)"
+            ]
+        },
+        {
+            "cell_type": "markdown",
+            "metadata": {},
+            "source": ["# Task 3", "#### Your Solution"]
+        },
+        {
+            "cell_type": "code",
+            "execution_count": 2,
+            "metadata": {},
+            "outputs": [],
+            "source": [
+                "def sort_list(arr):",
+                "    return sorted(arr)"
+            ]
+        }
+    ]
+}
+
+_SAMPLE_RUBRIC_DATA = (
+    ("Task 2", "Correctness of implementation", "", "5"),
+    ("Task 2", "Code efficiency", "", "3"),
+    ("Task 3", "Correct sorting algorithm", "", "4"),
+    ("Task 3", "Edge case handling", "", "2"),
+    ("Task 4", "Data structure usage", "", "6"),
+    ("Task 4", "Algorithm complexity", "", "4"),
+)
+
+_FIXTURES_DIR_NOTEBOOK = {
+    "cells": [
+        {
+            "cell_type": "markdown",
+            "source": ["#### Your Solution"]
+        },
+        {
+            "cell_type": "code",
+            "source": ["print('Hello, World!')"]
+        }
+    ]
+}
+
+# Serialized notebook payloads, so fixtures only have to write them out
+_COMPLETE_NOTEBOOK_JSON = dumps(_COMPLETE_NOTEBOOK)
+_MISSING_TASKS_NOTEBOOK_JSON = dumps(_MISSING_TASKS_NOTEBOOK)
+_SAMPLE_NOTEBOOK_JSON = dumps(_SAMPLE_NOTEBOOK_DICT)
+_FIXTURES_DIR_NOTEBOOK_JSON = dumps(_FIXTURES_DIR_NOTEBOOK, indent=False)
+
+_SAMPLE_RUBRIC_CSV = _to_csv_text([_RUBRIC_HEADER, *_SAMPLE_RUBRIC_DATA])
+
+# Markers applied automatically from node id keywords: integration tests,
+# tests that might be slow, and tests requiring API access
+_AUTO_MARKERS = ('integration', 'slow', 'requires_api')
+_AUTO_MARKER_RE = re.compile(
+    r"(?=(?P<integration>integration)"
+    r"|(?P<slow>complete|workflow|batch)"
+    r"|(?P<requires_api>api|openai|evaluator))"
+)
+
+# pathlib.Path methods patched by mock_file_operations, with their default returns
+_FILE_OP_DEFAULTS = (
+    ('exists', True),
+    ('mkdir', None),
+    ('write_text', None),
+    ('read_text', '{"cells": []}'),
+)
+
+
+@pytest.fixture
+def tmp_path(tmp_path, request):
+    """Wrap pytest's tmp_path, removing it after the test with --cleanup-tmp."""
+    yield tmp_path
+    
+    if request.config.getoption("--cleanup-tmp"):
+        shutil.rmtree(tmp_path, ignore_errors=True)
 
 
 @pytest.fixture(scope="session")
@@ -23,245 +256,123 @@ def test_data_dir():
 
 
 @pytest.fixture
-def mock_openai_api_key():
+def mock_openai_api_key(monkeypatch):
     """Provide a mock OpenAI API key for testing."""
-    with patch.dict(os.environ, {'OPENAI_API_KEY': 'test-api-key-12345'}):
-        yield 'test-api-key-12345'
+    monkeypatch.setenv('OPENAI_API_KEY', 'test-api-key-12345')
+    return 'test-api-key-12345'
 
 
-@pytest.fixture
-def valid_rubric_path(tmp_path):
-    """Create a valid rubric CSV file for testing."""
-    rubric_data = [
-        ["Task", "Criterion", "Score", "Max Points"],
-        ["Task 2", "Correctness of recursive implementation", "", "4"],
-        ["", "Proper base case handling", "", "2"],
-        ["", "Code efficiency", "", "2"],
-        ["Task 3", "Correct sorting algorithm implementation", "", "5"],
-        ["", "Proper array manipulation", "", "3"],
-        ["", "Edge case handling", "", "2"],
-        ["Task 4", "Data structure usage", "", "6"],
-        ["", "Algorithm efficiency", "", "5"],
-        ["", "Code readability", "", "4"],
-        ["Task 5", "Problem decomposition", "", "6"],
-        ["", "Function design", "", "5"],
-        ["", "Error handling", "", "4"],
-        ["Task 6", "Object-oriented design", "", "6"],
-        ["", "Encapsulation", "", "5"],
-        ["", "Code documentation", "", "4"],
-        ["Task 7", "Algorithm complexity", "", "8"],
-        ["", "Optimization techniques", "", "7"],
-        ["", "Performance analysis", "", "5"]
-    ]
-    
-    rubric_file = tmp_path / "valid_rubric.csv"
-    with open(rubric_file, 'w', newline='') as f:
-        writer = csv.writer(f)
-        writer.writerows(rubric_data)
-    
+@pytest.fixture(scope="session")
+def valid_rubric_path(tmp_path_factory):
+    """Create a valid rubric CSV file for testing (session-shared, read-only)."""
+    rubric_file = tmp_path_factory.mktemp("rubrics") / "valid_rubric.csv"
+    rubric_file.write_text(_VALID_RUBRIC_CSV)
     return str(rubric_file)
 
 
-@pytest.fixture
-def invalid_rubric_path(tmp_path):
-    """Create an invalid rubric CSV file for testing."""
-    rubric_data = [
-        ["Task", "Criterion", "Score", "Max Points"],
-        ["Task 2", "Some criterion", "", "invalid_points"],  # Invalid points
-        ["", "Another criterion", "", ""],  # Missing points
-        ["Task 9", "Out of range task", "", "5"],  # Invalid task number
-        ["", "", "", "3"],  # Missing criterion
-    ]
-    
-    rubric_file = tmp_path / "invalid_rubric.csv"
-    with open(rubric_file, 'w', newline='') as f:
-        writer = csv.writer(f)
-        writer.writerows(rubric_data)
-    
+@pytest.fixture(scope="session")
+def invalid_rubric_path(tmp_path_factory):
+    """Create an invalid rubric CSV file for testing (session-shared, read-only)."""
+    rubric_file = tmp_path_factory.mktemp("rubrics") / "invalid_rubric.csv"
+    rubric_file.write_text(_INVALID_RUBRIC_CSV)
     return str(rubric_file)
 
 
-@pytest.fixture
-def complete_notebook_path(tmp_path):
-    """Create a complete notebook file for testing."""
-    notebook_content = {
-        "metadata": {
-            "kernelspec": {
-                "display_name": "Python 3",
-                "language": "python",
-                "name": "python3"
-            }
-        },
-        "nbformat": 4,
-        "nbformat_minor": 4,
-        "cells": [
-            {
-                "cell_type": "markdown",
-                "metadata": {},
-                "source": ["# Task 2", "#### Your Solution"]
-            },
-            {
-                "cell_type": "code",
-                "execution_count": 1,
-                "metadata": {},
-                "outputs": [],
-                "source": [
-                    "def fibonacci(n):",
-                    "    if n <= 1:",
-                    "        return n",
-                    "    return fibonacci(n-1) + fibonacci(n-2)"
-                ]
-            },
-            {
-                "cell_type": "markdown",
-                "metadata": {},
-                "source": ["# Task 3", "#### Your Solution"]
-            },
-            {
-                "cell_type": "code",
-                "execution_count": 2,
-                "metadata": {},
-                "outputs": [],
-                "source": [
-                    "def sort_array(arr):",
-                    "    return sorted(arr)"
-                ]
-            }
-        ]
-    }
-    
-    notebook_file = tmp_path / "complete_notebook.ipynb"
-    notebook_file.write_text(json.dumps(notebook_content, indent=2))
+@pytest.fixture(scope="session")
+def complete_notebook_path(tmp_path_factory):
+    """Create a complete notebook file for testing (session-shared, read-only)."""
+    notebook_file = tmp_path_factory.mktemp("notebooks") / "complete_notebook.ipynb"
+    notebook_file.write_bytes(_COMPLETE_NOTEBOOK_JSON)
     return str(notebook_file)
 
 
-@pytest.fixture
-def missing_tasks_notebook_path(tmp_path):
-    """Create a notebook with missing tasks for testing."""
-    notebook_content = {
-        "metadata": {
-            "kernelspec": {
-                "display_name": "Python 3",
-                "language": "python",
-                "name": "python3"
-            }
-        },
-        "nbformat": 4,
-        "nbformat_minor": 4,
-        "cells": [
-            {
-                "cell_type": "markdown",
-                "metadata": {},
-                "source": ["# Task 2", "#### Your Solution"]
-            },
-            {
-                "cell_type": "code",
-                "execution_count": 1,
-                "metadata": {},
-                "outputs": [],
-                "source": ["print('Hello World')"]
-            }
-            # Missing other tasks
-        ]
-    }
-    
-    notebook_file = tmp_path / "missing_tasks_notebook.ipynb"
-    notebook_file.write_text(json.dumps(notebook_content, indent=2))
+@pytest.fixture(scope="session")
+def missing_tasks_notebook_path(tmp_path_factory):
+    """Create a notebook with missing tasks for testing (session-shared, read-only)."""
+    notebook_file = tmp_path_factory.mktemp("notebooks") / "missing_tasks_notebook.ipynb"
+    notebook_file.write_bytes(_MISSING_TASKS_NOTEBOOK_JSON)
     return str(notebook_file)
 
 
 @pytest.fixture
 def sample_notebook_content():
     """Provide sample notebook content for testing."""
-    return {
-        "metadata": {
-            "kernelspec": {
-                "display_name": "Python 3",
-                "language": "python",
-                "name": "python3"
-            }
-        },
-        "nbformat": 4,
-        "nbformat_minor": 4,
-        "cells": [
-            {
-                "cell_type": "markdown",
-                "metadata": {},
-                "source": ["# Task 2", "#### Your Solution"]
-            },
-            {
-                "cell_type": "code",
-                "execution_count": 1,
-                "metadata": {},
-                "outputs": [],
-                "source": [
-                    "def fibonacci(n):",
-                    "    if n <= 1:",
-                    "        return n",
-                    "    return fibonacci(n-1) + fibonacci(n-2)"
-                ]
-            },
-            {
-                "cell_type": "markdown",
-                "metadata": {},
-                "source": ["# Task 3", "#### Your Solution"]
-            },
-            {
-                "cell_type": "code",
-                "execution_count": 2,
-                "metadata": {},
-                "outputs": [],
-                "source": [
-                    "def sort_list(arr):",
-                    "    return sorted(arr)"
-                ]
-            }
-        ]
-    }
+    # Deep copy so a test editing cells cannot affect later tests
+    return copy.deepcopy(_SAMPLE_NOTEBOOK_DICT)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_rubric_data():
     """Provide sample rubric data for testing."""
-    return [
-        ["Task 2", "Correctness of implementation", "", "5"],
-        ["Task 2", "Code efficiency", "", "3"],
-        ["Task 3", "Correct sorting algorithm", "", "4"],
-        ["Task 3", "Edge case handling", "", "2"],
-        ["Task 4", "Data structure usage", "", "6"],
-        ["Task 4", "Algorithm complexity", "", "4"]
-    ]
+    return _SAMPLE_RUBRIC_DATA
 
 
 @pytest.fixture
-def create_test_notebook(tmp_path, sample_notebook_content):
+def create_test_notebook(tmp_path):
     """Create a test notebook file."""
     def _create_notebook(filename="test_notebook.ipynb", content=None):
         if content is None:
-            content = sample_notebook_content
+            notebook_json = _SAMPLE_NOTEBOOK_JSON
+        else:
+            notebook_json = dumps(content)
         
         notebook_file = tmp_path / filename
-        notebook_file.write_text(json.dumps(content, indent=2))
+        notebook_file.write_bytes(notebook_json)
         return notebook_file
     
     return _create_notebook
 
 
 @pytest.fixture
-def create_test_rubric(tmp_path, sample_rubric_data):
+def create_test_rubric(tmp_path):
     """Create a test rubric CSV file."""
     def _create_rubric(filename="test_rubric.csv", data=None):
         if data is None:
-            data = sample_rubric_data
+            rubric_csv = _SAMPLE_RUBRIC_CSV
+        else:
+            rubric_csv = _to_csv_text([_RUBRIC_HEADER, *data])
         
         rubric_file = tmp_path / filename
-        df = pd.DataFrame(data, columns=["Task", "Criterion", "Score", "Max Points"])
-        df.to_csv(rubric_file, index=False)
+        rubric_file.write_text(rubric_csv)
         return rubric_file
     
     return _create_rubric
 
 
+@functools.lru_cache(maxsize=1)
+def _default_evaluation_result():
+    """Build the shared default EvaluationResult returned by mocked evaluators."""
+    from src.marking.criterion_evaluator import EvaluationResult
+    return EvaluationResult(
+        score=3,
+        confidence=0.8,
+        raw_response="Good implementation",
+        error=None,
+        retry_count=0
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _default_marking_result():
+    """Build the shared default MarkingResult returned by mocked markers."""
+    from src.marking.assignment_marker import MarkingResult, TaskResult
+    return MarkingResult(
+        student_id="test_student",
+        total_score=10,
+        max_points=15,
+        task_results={
+            2: TaskResult(
+                task_number=2,
+                code="print('test')",
+                total_score=10,
+                max_points=15
+            )
+        },
+        status="Completed",
+        processing_time=1.5
+    )
+
+
 @pytest.fixture
 def mock_criterion_evaluator():
     """Provide a mock criterion evaluator for testing."""
@@ -270,15 +381,7 @@ def mock_criterion_evaluator():
         mock_class.return_value = mock_evaluator
         
         # Default evaluation result
-        from src.marking.criterion_evaluator import EvaluationResult
-        default_result = EvaluationResult(
-            score=3,
-            confidence=0.8,
-            raw_response="Good implementation",
-            error=None,
-            retry_count=0
-        )
-        mock_evaluator.evaluate_criterion.return_value = default_result
+        mock_evaluator.evaluate_criterion.return_value = _default_evaluation_result()
         
         yield mock_evaluator
 
@@ -306,22 +409,11 @@ def test_output_dir(tmp_path):
 
 
 @pytest.fixture
-def clean_environment():
+def clean_environment(monkeypatch):
     """Provide a clean environment for testing."""
-    # Store original environment
-    original_env = dict(os.environ)
-    
-    # Clear relevant environment variables
-    env_vars_to_clear = ['OPENAI_API_KEY', 'DSPY_CACHE_DIR']
-    for var in env_vars_to_clear:
-        if var in os.environ:
-            del os.environ[var]
-    
-    yield
-    
-    # Restore original environment
-    os.environ.clear()
-    os.environ.update(original_env)
+    # monkeypatch restores only the variables it removed
+    for var in ('OPENAI_API_KEY', 'DSPY_CACHE_DIR'):
+        monkeypatch.delenv(var, raising=False)
 
 
 @pytest.fixture
@@ -339,29 +431,12 @@ def test_fixtures_dir(tmp_path_factory):
     fixtures_dir = tmp_path_factory.mktemp("fixtures")
     
     # Create sample files that can be reused across tests
-    sample_notebook = {
-        "cells": [
-            {
-                "cell_type": "markdown",
-                "source": ["#### Your Solution"]
-            },
-            {
-                "cell_type": "code",
-                "source": ["print('Hello, World!')"]
-            }
-        ]
-    }
-    
     notebook_file = fixtures_dir / "sample.ipynb"
-    notebook_file.write_text(json.dumps(sample_notebook))
+    notebook_file.write_bytes(_FIXTURES_DIR_NOTEBOOK_JSON)
     
     # Create sample rubric
-    sample_rubric_data = [
-        ["Task 2", "Test criterion", "", "5"]
-    ]
     rubric_file = fixtures_dir / "sample_rubric.csv"
-    df = pd.DataFrame(sample_rubric_data, columns=["Task", "Criterion", "Score", "Max Points"])
-    df.to_csv(rubric_file, index=False)
+    rubric_file.write_text(_FIXTURES_DIR_RUBRIC_CSV)
     
     return fixtures_dir
 
@@ -369,6 +444,7 @@ def test_fixtures_dir(tmp_path_factory):
 @pytest.fixture
 def isolated_temp_dir():
     """Provide an isolated temporary directory for each test."""
+    import tempfile
     with tempfile.TemporaryDirectory() as temp_dir:
         yield Path(temp_dir)
 
@@ -381,24 +457,7 @@ def mock_assignment_marker():
         mock_class.return_value = mock_marker
         
         # Default return values
-        from src.marking.assignment_marker import MarkingResult, TaskResult
-        default_result = MarkingResult(
-            student_id="test_student",
-            total_score=10,
-            max_points=15,
-            task_results={
-                2: TaskResult(
-                    task_number=2,
-                    code="print('test')",
-                    total_score=10,
-                    max_points=15
-                )
-            },
-            status="Completed",
-            processing_time=1.5
-        )
-        
-        mock_marker.mark_assignment.return_value = default_result
+        mock_marker.mark_assignment.return_value = _default_marking_result()
         mock_marker.validate_setup.return_value = []
         mock_marker.get_statistics.return_value = {
             'assignments_processed': 1,
@@ -422,28 +481,25 @@ def capture_logs(caplog):
 @pytest.fixture
 def mock_file_operations():
     """Mock file operations for testing without actual file I/O."""
-    mocks = {}
-    
-    with patch('pathlib.Path.exists') as mock_exists, \
-         patch('pathlib.Path.mkdir') as mock_mkdir, \
-         patch('pathlib.Path.write_text') as mock_write_text, \
-         patch('pathlib.Path.read_text') as mock_read_text:
-        
-        mocks['exists'] = mock_exists
-        mocks['mkdir'] = mock_mkdir
-        mocks['write_text'] = mock_write_text
-        mocks['read_text'] = mock_read_text
-        
-        # Default behaviors
-        mock_exists.return_value = True
-        mock_mkdir.return_value = None
-        mock_write_text.return_value = None
-        mock_read_text.return_value = '{"cells": []}'
-        
+    with ExitStack() as stack:
+        mocks = {
+            name: stack.enter_context(patch(f'pathlib.Path.{name}', return_value=default))
+            for name, default in _FILE_OP_DEFAULTS
+        }
         yield mocks
 
 
 # Pytest configuration
+def pytest_addoption(parser):
+    """Register command line options for the test suite."""
+    parser.addoption(
+        "--cleanup-tmp",
+        action="store_true",
+        default=False,
+        help="delete each test's tmp_path directory as soon as the test finishes"
+    )
+
+
 def pytest_configure(config):
     """Configure pytest with custom markers."""
     config.addinivalue_line(
@@ -457,17 +513,24 @@ def pytest_configure(config):
     )
 
 
+def _auto_marker_names(text):
+    """Return the automatic marker names whose keywords occur in text."""
+    # The lookahead also catches overlapping keywords
+    return frozenset(match.lastgroup for match in _AUTO_MARKER_RE.finditer(text))
+
+
 def pytest_collection_modifyitems(config, items):
     """Modify test collection to add markers automatically."""
+    # Tests in one file share the path part of their node id, so scan it once
+    markers_by_path = {}
     for item in items:
-        # Mark integration tests
-        if "integration" in item.nodeid or "test_integration" in item.nodeid:
-            item.add_marker(pytest.mark.integration)
-        
-        # Mark tests that might be slow
-        if any(keyword in item.nodeid for keyword in ["complete", "workflow", "batch"]):
-            item.add_marker(pytest.mark.slow)
+        path, _, rest = item.nodeid.partition("::")
+        found = markers_by_path.get(path)
+        if found is None:
+            found = markers_by_path[path] = _auto_marker_names(path)
+        if rest:
+            found = found | _auto_marker_names(rest)
         
-        # Mark tests requiring API
-        if any(keyword in item.nodeid for keyword in ["api", "openai", "evaluator"]):
-            item.add_marker(pytest.mark.requires_api)
+        for marker_name in _AUTO_MARKERS:
+            if marker_name in found:
+                item.add_marker(getattr(pytest.mark, marker_name))
@@ -10,21 +10,22 @@ This module provides different types of code templates:
 All templates are realistic and match expected student submissions.
 """
 
-from typing import Dict
-from .error_templates import ErrorCodeTemplates, SpecialCharTemplates
+import functools
+import sys
+from typing import Iterable, List, Optional, Tuple
 
 
-class CodeTemplateProvider:
-    """Provides code templates for different scenarios."""
-    
-    def __init__(self):
-        self.error_templates = ErrorCodeTemplates()
-        self.special_templates = SpecialCharTemplates()
-    
-    def get_perfect_code(self, task_num: int) -> str:
-        """Get perfect code implementation for a task."""
-        templates = {
-            2: '''# Task 2: Basic data manipulation
+def _interned(templates: Tuple[Optional[str], ...]) -> Tuple[Optional[str], ...]:
+    """Intern template strings so equal templates share one object."""
+    return tuple(None if template is None else sys.intern(template)
+                 for template in templates)
+
+
+# Perfect implementations, indexed by task number (tasks 2-7)
+_PERFECT_TEMPLATES: Tuple[Optional[str], ...] = _interned((
+    None,
+    None,
+    '''# Task 2: Basic data manipulation
 import pandas as pd
 import numpy as np
 
@@ -48,7 +49,7 @@ df = load_and_clean_data('sample_data.csv')
 results = analyze_data(df)
 print(results)''',
             
-            3: '''# Task 3: Data visualization
+    '''# Task 3: Data visualization
 import matplotlib.pyplot as plt
 import seaborn as sns
 
@@ -76,7 +77,7 @@ def create_scatter_plot(data, x_col, y_col):
 create_histogram(df, 'value')
 create_scatter_plot(df, 'x', 'y')''',
             
-            4: '''# Task 4: Advanced data processing
+    '''# Task 4: Advanced data processing
 from sklearn.preprocessing import StandardScaler
 from sklearn.cluster import KMeans
 
@@ -104,7 +105,7 @@ clusters, model = perform_clustering(df_processed)
 df['cluster'] = clusters
 print(f"Clustering completed with {len(set(clusters))} clusters")''',
             
-            5: '''# Task 5: Statistical analysis
+    '''# Task 5: Statistical analysis
 from scipy import stats
 import statsmodels.api as sm
 
@@ -143,7 +144,7 @@ test_result = hypothesis_testing(df[df['cluster'] == 0]['value'],
 print(f"Found {len(strong_correlations)} strong correlations")
 print(f"T-test p-value: {test_result['p_value']:.4f}")''',
             
-            6: '''# Task 6: Model evaluation and validation
+    '''# Task 6: Model evaluation and validation
 from sklearn.model_selection import train_test_split, cross_val_score
 from sklearn.ensemble import RandomForestRegressor
 from sklearn.metrics import mean_squared_error, r2_score
@@ -187,7 +188,7 @@ results = train_model(X, y)
 print(f"Model R² Score: {results['r2']:.4f}")
 print(f"Cross-validation Score: {results['cv_mean']:.4f} ± {results['cv_std']:.4f}")''',
             
-            7: '''# Task 7: Comprehensive reporting and conclusions
+    '''# Task 7: Comprehensive reporting and conclusions
 import matplotlib.pyplot as plt
 import seaborn as sns
 from matplotlib.backends.backend_pdf import PdfPages
@@ -245,14 +246,13 @@ print(f"2. Identified {summary['clusters_found']} distinct clusters")
 print(f"3. Model achieved R² score of {summary['model_performance']:.3f}")
 print(f"4. Found {summary['significant_correlations']} strong correlations")
 print("Analysis demonstrates successful data exploration and modeling.")'''
-        }
-        
-        return templates.get(task_num, f"# Task {task_num}: Basic implementation\\nprint('Task {task_num} completed')")
-    
-    def get_partial_code(self, task_num: int) -> str:
-        """Get partial/incomplete code implementation."""
-        templates = {
-            2: '''# Task 2: Basic data manipulation
+))
+
+# Partial/incomplete implementations, indexed by task number (tasks 2-7)
+_PARTIAL_TEMPLATES: Tuple[Optional[str], ...] = _interned((
+    None,
+    None,
+    '''# Task 2: Basic data manipulation
 import pandas as pd
 # TODO: Add numpy import
 
@@ -266,7 +266,7 @@ def load_and_clean_data(file_path):
 # df = load_and_clean_data('sample_data.csv')
 # print("Data loaded but not analyzed")''',
             
-            3: '''# Task 3: Data visualization  
+    '''# Task 3: Data visualization  
 import matplotlib.pyplot as plt
 # Missing seaborn import
 
@@ -280,7 +280,7 @@ def create_histogram(data, column):
 # Missing scatter plot function
 # create_histogram(df, 'value')''',
             
-            4: '''# Task 4: Advanced data processing
+    '''# Task 4: Advanced data processing
 from sklearn.preprocessing import StandardScaler
 # Missing KMeans import
 
@@ -294,7 +294,7 @@ def preprocess_data(df):
 df_processed = preprocess_data(df)
 print("Preprocessing complete, but no clustering performed")''',
             
-            5: '''# Task 5: Statistical analysis
+    '''# Task 5: Statistical analysis
 from scipy import stats
 # Missing imports
 
@@ -306,7 +306,7 @@ def correlation_analysis(df):
 corr = correlation_analysis(df)
 print("Basic correlation computed")''',
             
-            6: '''# Task 6: Model evaluation
+    '''# Task 6: Model evaluation
 from sklearn.model_selection import train_test_split
 # Missing other imports
 
@@ -317,7 +317,7 @@ def basic_split(X, y):
 # Missing model training and evaluation
 print("Data split but no model trained")''',
             
-            7: '''# Task 7: Basic reporting
+    '''# Task 7: Basic reporting
 import matplotlib.pyplot as plt
 
 def basic_plot(df):
@@ -329,14 +329,102 @@ def basic_plot(df):
 # Missing comprehensive reporting
 basic_plot(df)
 print("Basic visualization created")'''
-        }
+))
+
+# Fallbacks for tasks without a template, formatted with the task number
+_PERFECT_FALLBACK = "# Task {task_num}: Basic implementation\\nprint('Task {task_num} completed')"
+_PARTIAL_FALLBACK = "# Task {task_num}: Incomplete\\n# TODO: Implement this task"
+
+# Template kind -> (templates indexed by task number, fallback for other tasks)
+_TEMPLATES = {
+    'perfect': (_PERFECT_TEMPLATES, _PERFECT_FALLBACK),
+    'partial': (_PARTIAL_TEMPLATES, _PARTIAL_FALLBACK),
+}
+
+
+def _template_entry(kind: str) -> Tuple[Tuple[Optional[str], ...], str]:
+    """Look up the templates and fallback for a template kind."""
+    entry = _TEMPLATES.get(kind)
+    if entry is None:
+        # Syntax error and special character templates are imported on first use
+        from .error_templates import _TEMPLATES as error_kinds
+        entry = error_kinds[kind]
+    return entry
+
+
+@functools.lru_cache(maxsize=64)
+def _fallback(kind: str, task_num: int) -> str:
+    """Format the fallback of a kind for a task without a template."""
+    return sys.intern(_template_entry(kind)[1].format(task_num=task_num))
+
+
+def _template_at(templates: Tuple[Optional[str], ...], task_num: int) -> Optional[str]:
+    """Return the template stored for a task number, or None if there is none."""
+    try:
+        return templates[task_num] if task_num >= 0 else None
+    except (IndexError, TypeError):
+        return None
+
+
+def _get_template(kind: str, task_num: int) -> str:
+    """Get the template of a kind for a task, or the kind's fallback."""
+    template = _template_at(_template_entry(kind)[0], task_num)
+    return template if template is not None else _fallback(kind, task_num)
+
+
+class CodeTemplateProvider:
+    """Provides code templates for different scenarios."""
+    
+    def __init__(self):
+        # error_templates imports this module, so it is imported here
+        from .error_templates import ErrorCodeTemplates, SpecialCharTemplates
+        self.error_templates = ErrorCodeTemplates()
+        self.special_templates = SpecialCharTemplates()
+    
+    @staticmethod
+    def get(kind: str, task_num: int) -> str:
+        """
+        Get a code template for a task.
+        
+        Args:
+            kind: Template kind: 'perfect', 'partial', 'syntax_error' or 'special_chars'
+            task_num: Task number
+            
+        Returns:
+            The template code, or a short placeholder for tasks without one
+        """
+        return _get_template(kind, task_num)
+    
+    @staticmethod
+    def get_many(kind: str, task_nums: Iterable[int]) -> List[str]:
+        """
+        Get code templates of one kind for several tasks.
         
-        return templates.get(task_num, f"# Task {task_num}: Incomplete\\n# TODO: Implement this task")
+        Args:
+            kind: Template kind, as for get()
+            task_nums: Task numbers
+            
+        Returns:
+            Templates in the same order as task_nums
+        """
+        return [_get_template(kind, task_num) for task_num in task_nums]
+    
+    @staticmethod
+    def get_perfect_code(task_num: int) -> str:
+        """Get perfect code implementation for a task."""
+        return _get_template('perfect', task_num)
+    
+    @staticmethod
+    def get_partial_code(task_num: int) -> str:
+        """Get partial/incomplete code implementation."""
+        return _get_template('partial', task_num)
     
-    def get_syntax_error_code(self, task_num: int) -> str:
+    @staticmethod
+    def get_syntax_error_code(task_num: int) -> str:
         """Get code with syntax errors for testing."""
-        return self.error_templates.get_syntax_error_code(task_num)
+        return _get_template('syntax_error', task_num)
     
-    def get_special_chars_code(self, task_num: int) -> str:
+    @staticmethod
+    def get_special_chars_code(task_num: int) -> str:
         """Get code with special characters for testing."""
-        return self.special_templates.get_special_chars_code(task_num)
+        return _get_template('special_chars', task_num)
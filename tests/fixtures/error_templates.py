@@ -9,16 +9,16 @@ This module extends the code template provider with:
 These templates create realistic test scenarios for error handling.
 """
 
-from typing import Dict
+from typing import Optional, Tuple
 
+from .code_templates import _get_template, _interned
 
-class ErrorCodeTemplates:
-    """Provides code templates with syntax errors."""
-    
-    def get_syntax_error_code(self, task_num: int) -> str:
-        """Get code with syntax errors for testing."""
-        templates = {
-            2: '''# Task 2: Data manipulation with syntax errors
+
+# Code with syntax errors, indexed by task number (tasks 2-7)
+_SYNTAX_ERROR_TEMPLATES: Tuple[Optional[str], ...] = _interned((
+    None,
+    None,
+    '''# Task 2: Data manipulation with syntax errors
 import pandas as pd
 import numpy as np
 
@@ -36,7 +36,7 @@ df = load_and_clean_data('data.csv')
     results = analyze_data(df)  # Wrong indentation
 print(results)''',
             
-            3: '''# Task 3: Visualization with errors
+    '''# Task 3: Visualization with errors
 import matplotlib.pyplot as plt
 
 def create_plot(data):
@@ -48,7 +48,7 @@ def create_plot(data):
 # Undefined variable
 create_plot(undefined_df)  # This variable doesn't exist''',
             
-            4: '''# Task 4: Processing with errors
+    '''# Task 4: Processing with errors
 from sklearn.preprocessing import StandardScaler
 
 def preprocess_data(df):
@@ -60,7 +60,7 @@ def preprocess_data(df):
 
 df_processed = preprocess_data(df)''',
             
-            5: '''# Task 5: Analysis with errors
+    '''# Task 5: Analysis with errors
 from scipy import stats
 
 def correlation_test(x, y):
@@ -72,7 +72,7 @@ def correlation_test(x, y):
 test_result = correlation_test(df['x'], df['y'])
 print(test_result''',  # Missing closing parenthesis
             
-            6: '''# Task 6: Model with errors
+    '''# Task 6: Model with errors
 from sklearn.ensemble import RandomForestRegressor
 
 def train_model(X, y):
@@ -84,7 +84,7 @@ def train_model(X, y):
 
 model = train_model(X, y)''',
             
-            7: '''# Task 7: Reporting with errors
+    '''# Task 7: Reporting with errors
 import matplotlib.pyplot as plt
 
 def generate_report():
@@ -100,18 +100,13 @@ def generate_report():
         'std': df.std()  # Missing comma
     }
     return summary'''
-        }
-        
-        return templates.get(task_num, f"# Task {task_num}: Syntax error\\nprint('Error example' + 123)  # Type error")
-
+))
 
-class SpecialCharTemplates:
-    """Provides code templates with special characters and unicode."""
-    
-    def get_special_chars_code(self, task_num: int) -> str:
-        """Get code with special characters for testing."""
-        templates = {
-            2: '''# Task 2: Data manipulation with special characters
+# Code with special characters and unicode, indexed by task number (tasks 2-7)
+_SPECIAL_CHARS_TEMPLATES: Tuple[Optional[str], ...] = _interned((
+    None,
+    None,
+    '''# Task 2: Data manipulation with special characters
 import pandas as pd
 import numpy as np
 
@@ -133,7 +128,7 @@ def load_data_with_encoding(file_path):
 message = "Data loaded successfully! 🎉 Température: 25°C ± 2°C"
 print(message)''',
             
-            3: '''# Task 3: Visualization with unicode
+    '''# Task 3: Visualization with unicode
 import matplotlib.pyplot as plt
 
 def create_multilingual_plot(data):
@@ -154,7 +149,7 @@ def create_multilingual_plot(data):
 # Test with special characters
 print("Graphique créé avec succès! ✓")''',
             
-            4: '''# Task 4: Processing with international data
+    '''# Task 4: Processing with international data
 from sklearn.preprocessing import StandardScaler
 
 def process_international_data(df):
@@ -181,7 +176,7 @@ def process_international_data(df):
 # Status message with unicode
 print("Données internationales traitées ✨")''',
             
-            5: '''# Task 5: Statistical analysis with unicode
+    '''# Task 5: Statistical analysis with unicode
 from scipy import stats
 import numpy as np
 
@@ -208,7 +203,7 @@ print("Résultats statistiques:")
 for col, stats in stats_results.items():
     print(f"  {col}: μ = {stats['μ (mean)']:.2f}, σ = {stats['σ (std)']:.2f}")''',
             
-            6: '''# Task 6: Model evaluation with international text
+    '''# Task 6: Model evaluation with international text
 from sklearn.model_selection import cross_val_score
 from sklearn.ensemble import RandomForestRegressor
 
@@ -234,7 +229,7 @@ print("🎯 Évaluation du modèle terminée!")
 for lang, result in eval_results.items():
     print(f"  {lang}: {result}")''',
             
-            7: '''# Task 7: International reporting
+    '''# Task 7: International reporting
 import matplotlib.pyplot as plt
 import numpy as np
 
@@ -278,6 +273,36 @@ def generate_international_report(df, model_results):
 print("🔄 Génération du rapport en cours...")
 report = generate_international_report(df, results)
 print("✅ Rapport généré avec succès!")'''
-        }
-        
-        return templates.get(task_num, f"# Task {task_num}: Special chars\\nprint('Spéciał cháracters: áéíóú 中文 🎉')")
+))
+
+# Fallbacks for tasks without a template, formatted with the task number
+_SYNTAX_ERROR_FALLBACK = "# Task {task_num}: Syntax error\\nprint('Error example' + 123)  # Type error"
+_SPECIAL_CHARS_FALLBACK = "# Task {task_num}: Special chars\\nprint('Spéciał cháracters: áéíóú 中文 🎉')"
+
+# Template kind -> (templates indexed by task number, fallback for other tasks)
+_TEMPLATES = {
+    'syntax_error': (_SYNTAX_ERROR_TEMPLATES, _SYNTAX_ERROR_FALLBACK),
+    'special_chars': (_SPECIAL_CHARS_TEMPLATES, _SPECIAL_CHARS_FALLBACK),
+}
+
+
+def get_syntax_error_code(task_num: int) -> str:
+    """Get code with syntax errors for testing."""
+    return _get_template('syntax_error', task_num)
+
+
+def get_special_chars_code(task_num: int) -> str:
+    """Get code with special characters for testing."""
+    return _get_template('special_chars', task_num)
+
+
+class ErrorCodeTemplates:
+    """Provides code templates with syntax errors."""
+    
+    get_syntax_error_code = staticmethod(get_syntax_error_code)
+
+
+class SpecialCharTemplates:
+    """Provides code templates with special characters and unicode."""
+    
+    get_special_chars_code = staticmethod(get_special_chars_code)
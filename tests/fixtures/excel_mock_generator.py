@@ -10,11 +10,140 @@ This module creates expected Excel outputs for:
 All outputs match the expected Excel format from the project brief.
 """
 
+import functools
+from types import MappingProxyType
 import pandas as pd
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 import openpyxl
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Font, Alignment, PatternFill
+from openpyxl.utils import get_column_letter
+from .fixture_cache import fixture_digest, is_current, record_digest
+
+try:
+    import pyexcelerate
+except ImportError:
+    pyexcelerate = None
+
+
+_COLUMNS = ("Task Name", "Criterion", "Score", "Max Points")
+
+# Styles are immutable, so one instance of each is shared by every styled cell
+_HEADER_FONT = Font(bold=True, color="FFFFFF")
+_HEADER_FILL = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
+_SUBTOTAL_FONT = Font(bold=True)
+_SUBTOTAL_FILL = PatternFill(start_color="D9E1F2", end_color="D9E1F2", fill_type="solid")
+_TOTAL_FONT = Font(bold=True, color="FFFFFF")
+_TOTAL_FILL = PatternFill(start_color="70AD47", end_color="70AD47", fill_type="solid")
+_ISSUES_FONT = Font(bold=True, color="C5504B")
+
+# (font, fill) for each row kind returned by _row_kind
+_ROW_STYLES = {
+    'header': (_HEADER_FONT, _HEADER_FILL),
+    'subtotal': (_SUBTOTAL_FONT, _SUBTOTAL_FILL),
+    'total': (_TOTAL_FONT, _TOTAL_FILL),
+    'issues': (_ISSUES_FONT, None),
+}
+
+
+# Marks for a perfect submission; read-only, copied by the create_* methods
+_PERFECT_ROWS = (
+    # Task 2 - 8 points
+    MappingProxyType({"Task Name": "Task 2", "Criterion": "Data loading implementation", "Score": 2, "Max Points": 2}),
+    MappingProxyType({"Task Name": "Task 2", "Criterion": "Data cleaning functionality", "Score": 2, "Max Points": 2}),
+    MappingProxyType({"Task Name": "Task 2", "Criterion": "Statistical analysis correctness", "Score": 2, "Max Points": 2}),
+    MappingProxyType({"Task Name": "Task 2", "Criterion": "Code organization and structure", "Score": 1, "Max Points": 1}),
+    MappingProxyType({"Task Name": "Task 2", "Criterion": "Documentation and comments", "Score": 1, "Max Points": 1}),
+    MappingProxyType({"Task Name": "Task 2 Subtotal", "Criterion": "", "Score": 8, "Max Points": 8}),
+    
+    # Task 3 - 10 points
+    MappingProxyType({"Task Name": "Task 3", "Criterion": "Histogram creation and formatting", "Score": 2, "Max Points": 2}),
+    MappingProxyType({"Task Name": "Task 3", "Criterion": "Scatter plot implementation", "Score": 2, "Max Points": 2}),
+    MappingProxyType({"Task Name": "Task 3", "Criterion": "Plot customization and labels", "Score": 2, "Max Points": 2}),
+    MappingProxyType({"Task Name": "Task 3", "Criterion": "Data visualization best practices", "Score": 2, "Max Points": 2}),
+    MappingProxyType({"Task Name": "Task 3", "Criterion": "Code quality and efficiency", "Score": 1, "Max Points": 1}),
+    MappingProxyType({"Task Name": "Task 3", "Criterion": "Error handling for plots", "Score": 1, "Max Points": 1}),
+    MappingProxyType({"Task Name": "Task 3 Subtotal", "Criterion": "", "Score": 10, "Max Points": 10}),
+    
+    # Task 4 - 15 points
+    MappingProxyType({"Task Name": "Task 4", "Criterion": "Data preprocessing implementation", "Score": 3, "Max Points": 3}),
+    MappingProxyType({"Task Name": "Task 4", "Criterion": "Feature scaling correctness", "Score": 2, "Max Points": 2}),
+    MappingProxyType({"Task Name": "Task 4", "Criterion": "Clustering algorithm application", "Score": 3, "Max Points": 3}),
+    MappingProxyType({"Task Name": "Task 4", "Criterion": "Parameter selection and tuning", "Score": 2, "Max Points": 2}),
+    MappingProxyType({"Task Name": "Task 4", "Criterion": "Results interpretation", "Score": 2, "Max Points": 2}),
+    MappingProxyType({"Task Name": "Task 4", "Criterion": "Code modularity and reusability", "Score": 2, "Max Points": 2}),
+    MappingProxyType({"Task Name": "Task 4", "Criterion": "Documentation and testing", "Score": 1, "Max Points": 1}),
+    MappingProxyType({"Task Name": "Task 4 Subtotal", "Criterion": "", "Score": 15, "Max Points": 15}),
+    
+    # Task 5 - 15 points
+    MappingProxyType({"Task Name": "Task 5", "Criterion": "Correlation analysis implementation", "Score": 3, "Max Points": 3}),
+    MappingProxyType({"Task Name": "Task 5", "Criterion": "Statistical test selection", "Score": 2, "Max Points": 2}),
+    MappingProxyType({"Task Name": "Task 5", "Criterion": "Hypothesis testing correctness", "Score": 3, "Max Points": 3}),
+    MappingProxyType({"Task Name": "Task 5", "Criterion": "Results interpretation and significance", "Score": 2, "Max Points": 2}),
+    MappingProxyType({"Task Name": "Task 5", "Criterion": "Statistical assumptions validation", "Score": 2, "Max Points": 2}),
+    MappingProxyType({"Task Name": "Task 5", "Criterion": "Code efficiency and clarity", "Score": 2, "Max Points": 2}),
+    MappingProxyType({"Task Name": "Task 5", "Criterion": "Documentation and explanations", "Score": 1, "Max Points": 1}),
+    MappingProxyType({"Task Name": "Task 5 Subtotal", "Criterion": "", "Score": 15, "Max Points": 15}),
+    
+    # Task 6 - 15 points
+    MappingProxyType({"Task Name": "Task 6", "Criterion": "Model selection and implementation", "Score": 3, "Max Points": 3}),
+    MappingProxyType({"Task Name": "Task 6", "Criterion": "Cross-validation methodology", "Score": 3, "Max Points": 3}),
+    MappingProxyType({"Task Name": "Task 6", "Criterion": "Performance metrics calculation", "Score": 3, "Max Points": 3}),
+    MappingProxyType({"Task Name": "Task 6", "Criterion": "Model evaluation and comparison", "Score": 3, "Max Points": 3}),
+    MappingProxyType({"Task Name": "Task 6", "Criterion": "Code organization and testing", "Score": 2, "Max Points": 2}),
+    MappingProxyType({"Task Name": "Task 6", "Criterion": "Documentation and interpretation", "Score": 1, "Max Points": 1}),
+    MappingProxyType({"Task Name": "Task 6 Subtotal", "Criterion": "", "Score": 15, "Max Points": 15}),
+    
+    # Task 7 - 20 points
+    MappingProxyType({"Task Name": "Task 7", "Criterion": "Comprehensive report generation", "Score": 5, "Max Points": 5}),
+    MappingProxyType({"Task Name": "Task 7", "Criterion": "Data visualization integration", "Score": 4, "Max Points": 4}),
+    MappingProxyType({"Task Name": "Task 7", "Criterion": "Statistical summary and insights", "Score": 4, "Max Points": 4}),
+    MappingProxyType({"Task Name": "Task 7", "Criterion": "Conclusions and recommendations", "Score": 4, "Max Points": 4}),
+    MappingProxyType({"Task Name": "Task 7", "Criterion": "Professional presentation quality", "Score": 3, "Max Points": 3}),
+    MappingProxyType({"Task Name": "Task 7 Subtotal", "Criterion": "", "Score": 20, "Max Points": 20}),
+    
+    # Grand Total
+    MappingProxyType({"Task Name": "TOTAL", "Criterion": "", "Score": 83, "Max Points": 83}),
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _pyexcelerate_styles() -> Dict[str, Any]:
+    """Build the pyexcelerate equivalents of the openpyxl styles above."""
+    white = pyexcelerate.Color(0xFF, 0xFF, 0xFF)
+    return {
+        'header': pyexcelerate.Style(font=pyexcelerate.Font(bold=True, color=white),
+                                     fill=pyexcelerate.Fill(background=pyexcelerate.Color(0x36, 0x60, 0x92))),
+        'subtotal': pyexcelerate.Style(font=pyexcelerate.Font(bold=True),
+                                       fill=pyexcelerate.Fill(background=pyexcelerate.Color(0xD9, 0xE1, 0xF2))),
+        'total': pyexcelerate.Style(font=pyexcelerate.Font(bold=True, color=white),
+                                    fill=pyexcelerate.Fill(background=pyexcelerate.Color(0x70, 0xAD, 0x47))),
+        'issues': pyexcelerate.Style(font=pyexcelerate.Font(bold=True, color=pyexcelerate.Color(0xC5, 0x50, 0x4B))),
+    }
+
+
+def _row_kind(task_name: Any) -> Optional[str]:
+    """Formatting category of a row from its Task Name value, or None if plain."""
+    task_name = str(task_name)
+    if task_name == 'TOTAL':
+        return 'total'
+    if 'Subtotal' in task_name:
+        return 'subtotal'
+    if 'ISSUES FOUND' in task_name:
+        return 'issues'
+    return None
+
+
+def _styled_columns(kind: str) -> int:
+    """Number of leading columns styled for a row kind; issues style only the label."""
+    return 1 if kind == 'issues' else len(_COLUMNS)
+
+
+def _column_widths(rows: List[List[Any]]) -> List[int]:
+    """Width of each column: longest value plus padding, capped at 50."""
+    return [min(max([len(column)] + [len(str(row[index])) for row in rows]) + 2, 50)
+            for index, column in enumerate(_COLUMNS)]
 
 
 class ExcelMockGenerator:
@@ -27,87 +156,25 @@ class ExcelMockGenerator:
     
     def create_perfect_student_excel_data(self) -> List[Dict[str, Any]]:
         """Create Excel data for perfect student."""
-        return [
-            # Task 2 - 8 points
-            {"Task Name": "Task 2", "Criterion": "Data loading implementation", "Score": 2, "Max Points": 2},
-            {"Task Name": "Task 2", "Criterion": "Data cleaning functionality", "Score": 2, "Max Points": 2},
-            {"Task Name": "Task 2", "Criterion": "Statistical analysis correctness", "Score": 2, "Max Points": 2},
-            {"Task Name": "Task 2", "Criterion": "Code organization and structure", "Score": 1, "Max Points": 1},
-            {"Task Name": "Task 2", "Criterion": "Documentation and comments", "Score": 1, "Max Points": 1},
-            {"Task Name": "Task 2 Subtotal", "Criterion": "", "Score": 8, "Max Points": 8},
-            
-            # Task 3 - 10 points
-            {"Task Name": "Task 3", "Criterion": "Histogram creation and formatting", "Score": 2, "Max Points": 2},
-            {"Task Name": "Task 3", "Criterion": "Scatter plot implementation", "Score": 2, "Max Points": 2},
-            {"Task Name": "Task 3", "Criterion": "Plot customization and labels", "Score": 2, "Max Points": 2},
-            {"Task Name": "Task 3", "Criterion": "Data visualization best practices", "Score": 2, "Max Points": 2},
-            {"Task Name": "Task 3", "Criterion": "Code quality and efficiency", "Score": 1, "Max Points": 1},
-            {"Task Name": "Task 3", "Criterion": "Error handling for plots", "Score": 1, "Max Points": 1},
-            {"Task Name": "Task 3 Subtotal", "Criterion": "", "Score": 10, "Max Points": 10},
-            
-            # Task 4 - 15 points
-            {"Task Name": "Task 4", "Criterion": "Data preprocessing implementation", "Score": 3, "Max Points": 3},
-            {"Task Name": "Task 4", "Criterion": "Feature scaling correctness", "Score": 2, "Max Points": 2},
-            {"Task Name": "Task 4", "Criterion": "Clustering algorithm application", "Score": 3, "Max Points": 3},
-            {"Task Name": "Task 4", "Criterion": "Parameter selection and tuning", "Score": 2, "Max Points": 2},
-            {"Task Name": "Task 4", "Criterion": "Results interpretation", "Score": 2, "Max Points": 2},
-            {"Task Name": "Task 4", "Criterion": "Code modularity and reusability", "Score": 2, "Max Points": 2},
-            {"Task Name": "Task 4", "Criterion": "Documentation and testing", "Score": 1, "Max Points": 1},
-            {"Task Name": "Task 4 Subtotal", "Criterion": "", "Score": 15, "Max Points": 15},
-            
-            # Task 5 - 15 points
-            {"Task Name": "Task 5", "Criterion": "Correlation analysis implementation", "Score": 3, "Max Points": 3},
-            {"Task Name": "Task 5", "Criterion": "Statistical test selection", "Score": 2, "Max Points": 2},
-            {"Task Name": "Task 5", "Criterion": "Hypothesis testing correctness", "Score": 3, "Max Points": 3},
-            {"Task Name": "Task 5", "Criterion": "Results interpretation and significance", "Score": 2, "Max Points": 2},
-            {"Task Name": "Task 5", "Criterion": "Statistical assumptions validation", "Score": 2, "Max Points": 2},
-            {"Task Name": "Task 5", "Criterion": "Code efficiency and clarity", "Score": 2, "Max Points": 2},
-            {"Task Name": "Task 5", "Criterion": "Documentation and explanations", "Score": 1, "Max Points": 1},
-            {"Task Name": "Task 5 Subtotal", "Criterion": "", "Score": 15, "Max Points": 15},
-            
-            # Task 6 - 15 points
-            {"Task Name": "Task 6", "Criterion": "Model selection and implementation", "Score": 3, "Max Points": 3},
-            {"Task Name": "Task 6", "Criterion": "Cross-validation methodology", "Score": 3, "Max Points": 3},
-            {"Task Name": "Task 6", "Criterion": "Performance metrics calculation", "Score": 3, "Max Points": 3},
-            {"Task Name": "Task 6", "Criterion": "Model evaluation and comparison", "Score": 3, "Max Points": 3},
-            {"Task Name": "Task 6", "Criterion": "Code organization and testing", "Score": 2, "Max Points": 2},
-            {"Task Name": "Task 6", "Criterion": "Documentation and interpretation", "Score": 1, "Max Points": 1},
-            {"Task Name": "Task 6 Subtotal", "Criterion": "", "Score": 15, "Max Points": 15},
-            
-            # Task 7 - 20 points
-            {"Task Name": "Task 7", "Criterion": "Comprehensive report generation", "Score": 5, "Max Points": 5},
-            {"Task Name": "Task 7", "Criterion": "Data visualization integration", "Score": 4, "Max Points": 4},
-            {"Task Name": "Task 7", "Criterion": "Statistical summary and insights", "Score": 4, "Max Points": 4},
-            {"Task Name": "Task 7", "Criterion": "Conclusions and recommendations", "Score": 4, "Max Points": 4},
-            {"Task Name": "Task 7", "Criterion": "Professional presentation quality", "Score": 3, "Max Points": 3},
-            {"Task Name": "Task 7 Subtotal", "Criterion": "", "Score": 20, "Max Points": 20},
-            
-            # Grand Total
-            {"Task Name": "TOTAL", "Criterion": "", "Score": 83, "Max Points": 83}
-        ]
+        return [dict(row) for row in _PERFECT_ROWS]
     
     def create_missing_tasks_excel_data(self) -> List[Dict[str, Any]]:
         """Create Excel data for student with missing tasks."""
         data = self.create_perfect_student_excel_data()
         
-        # Mark Task 4 as missing (set all scores to 0 with MISSING_TASK flag)
-        for row in data:
-            if row["Task Name"] == "Task 4" and row["Task Name"] != "Task 4 Subtotal":
-                row["Score"] = "0 (MISSING_TASK)"
-            elif row["Task Name"] == "Task 4 Subtotal":
-                row["Score"] = "0 (MISSING_TASK)"
+        # Tasks 4 and 6 are missing: their criteria and subtotals score 0 with
+        # a MISSING_TASK flag, and the total drops to 83 - 15 - 15 = 53
+        score_patches = {
+            "Task 4": "0 (MISSING_TASK)",
+            "Task 4 Subtotal": "0 (MISSING_TASK)",
+            "Task 6": "0 (MISSING_TASK)",
+            "Task 6 Subtotal": "0 (MISSING_TASK)",
+            "TOTAL": 53,
+        }
         
-        # Mark Task 6 as missing
         for row in data:
-            if row["Task Name"] == "Task 6" and row["Task Name"] != "Task 6 Subtotal":
-                row["Score"] = "0 (MISSING_TASK)"
-            elif row["Task Name"] == "Task 6 Subtotal":
-                row["Score"] = "0 (MISSING_TASK)"
-        
-        # Update total (83 - 15 - 15 = 53)
-        for row in data:
-            if row["Task Name"] == "TOTAL":
-                row["Score"] = 53
+            if row["Task Name"] in score_patches:
+                row["Score"] = score_patches[row["Task Name"]]
         
         return data
     
@@ -116,114 +183,137 @@ class ExcelMockGenerator:
         data = self.create_perfect_student_excel_data()
         
         # Mark some criteria with parsing errors
-        error_criteria = [
+        error_criteria = {
             ("Task 2", "Data loading implementation"),
             ("Task 3", "Histogram creation and formatting"),
             ("Task 5", "Correlation analysis implementation")
-        ]
-        
-        for row in data:
-            if (row["Task Name"], row["Criterion"]) in error_criteria:
-                row["Score"] = "0 (PARSING_ERROR)"
+        }
         
         # Update subtotals and total accordingly
         # Task 2: 8 - 2 = 6
         # Task 3: 10 - 2 = 8  
         # Task 5: 15 - 3 = 12
         # Total: 83 - 7 = 76
+        score_patches = {
+            "Task 2 Subtotal": 6,
+            "Task 3 Subtotal": 8,
+            "Task 5 Subtotal": 12,
+            "TOTAL": 76,
+        }
         
         for row in data:
-            if row["Task Name"] == "Task 2 Subtotal":
-                row["Score"] = 6
-            elif row["Task Name"] == "Task 3 Subtotal":
-                row["Score"] = 8
-            elif row["Task Name"] == "Task 5 Subtotal":
-                row["Score"] = 12
-            elif row["Task Name"] == "TOTAL":
-                row["Score"] = 76
+            if (row["Task Name"], row["Criterion"]) in error_criteria:
+                row["Score"] = "0 (PARSING_ERROR)"
+            elif row["Task Name"] in score_patches:
+                row["Score"] = score_patches[row["Task Name"]]
         
         return data
     
     def create_excel_with_issues_summary(self, data: List[Dict], issues: List[str]) -> pd.DataFrame:
         """Create Excel with issues summary section."""
-        df = pd.DataFrame(data)
-        
-        # Add blank rows and issues summary
+        # Add blank rows and issues summary; the DataFrame is built once
         blank_row = {"Task Name": "", "Criterion": "", "Score": "", "Max Points": ""}
         issues_header = {"Task Name": "ISSUES FOUND:", "Criterion": "", "Score": "", "Max Points": ""}
         
-        df = pd.concat([df, pd.DataFrame([blank_row, issues_header])], ignore_index=True)
-        
-        for issue in issues:
-            issue_row = {"Task Name": f"- {issue}", "Criterion": "", "Score": "", "Max Points": ""}
-            df = pd.concat([df, pd.DataFrame([issue_row])], ignore_index=True)
+        rows = list(data) + [blank_row, issues_header]
+        rows.extend({"Task Name": f"- {issue}", "Criterion": "", "Score": "", "Max Points": ""}
+                    for issue in issues)
         
-        return df
+        return pd.DataFrame.from_records(rows, columns=_COLUMNS)
     
     def save_excel_fixture(self, data: List[Dict], filename: str, issues: List[str] = None):
-        """Save Excel fixture with proper formatting."""
+        """
+        Save Excel fixture with proper formatting.
+        
+        Files whose rows are unchanged since the last run are not rewritten.
+        Uses pyexcelerate when it is installed, as it serializes small sheets
+        several times faster; otherwise the workbook is opened in openpyxl's
+        write-only mode, so rows are serialized as they are appended rather
+        than kept as cell objects.
+        
+        Args:
+            data: Marking rows keyed by column name
+            filename: Output file name without the .xlsx extension
+            issues: Optional issues to list below the marks
+        """
+        rows = [[row[column] for column in _COLUMNS] for row in data]
         if issues:
-            df = self.create_excel_with_issues_summary(data, issues)
-        else:
-            df = pd.DataFrame(data)
+            rows.append(["", "", "", ""])
+            rows.append(["ISSUES FOUND:", "", "", ""])
+            rows.extend([f"- {issue}", "", "", ""] for issue in issues)
         
         filepath = self.excel_mocks_dir / f"{filename}.xlsx"
         
-        # Create Excel with formatting
-        with pd.ExcelWriter(filepath, engine='openpyxl') as writer:
-            df.to_excel(writer, sheet_name='Marking Sheet', index=False)
-            
-            # Get workbook and worksheet for formatting
-            workbook = writer.book
-            worksheet = writer.sheets['Marking Sheet']
-            
-            # Apply formatting
-            self.apply_excel_formatting(worksheet, len(df))
+        # Skip rewriting when rows, writer and this module are unchanged
+        digest = fixture_digest(__file__, rows, pyexcelerate is not None)
+        if is_current(filepath, digest):
+            return
+        
+        if pyexcelerate is not None:
+            self.save_with_pyexcelerate(rows, filepath)
+        else:
+            workbook = openpyxl.Workbook(write_only=True)
+            worksheet = workbook.create_sheet('Marking Sheet')
+            self.write_formatted_rows(worksheet, rows)
+            workbook.save(filepath)
+        record_digest(filepath, digest)
     
-    def apply_excel_formatting(self, worksheet, num_rows: int):
-        """Apply formatting to Excel worksheet."""
-        # Header formatting
-        header_font = Font(bold=True, size=12)
-        header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
+    def write_formatted_rows(self, worksheet, rows: List[List[Any]]):
+        """
+        Write the header and rows to a write-only worksheet with formatting.
         
-        for cell in worksheet[1]:
-            cell.font = Font(bold=True, color="FFFFFF")
-            cell.fill = header_fill
+        Column widths must be set before the first row is appended, so they
+        are sized from the values up front; styled rows use WriteOnlyCell.
         
-        # Subtotal row formatting
-        subtotal_font = Font(bold=True)
-        subtotal_fill = PatternFill(start_color="D9E1F2", end_color="D9E1F2", fill_type="solid")
+        Args:
+            worksheet: Worksheet of a write-only workbook
+            rows: Row values in column order, without the header
+        """
+        # Auto-adjust column widths
+        for index, width in enumerate(_column_widths(rows)):
+            worksheet.column_dimensions[get_column_letter(index + 1)].width = width
         
-        for row_num in range(2, num_rows + 2):
-            cell_value = worksheet[f'A{row_num}'].value
-            if cell_value and ('Subtotal' in str(cell_value) or cell_value == 'TOTAL'):
-                for col in range(1, 5):
-                    cell = worksheet.cell(row=row_num, column=col)
-                    cell.font = subtotal_font
-                    if cell_value == 'TOTAL':
-                        cell.fill = PatternFill(start_color="70AD47", end_color="70AD47", fill_type="solid")
-                        cell.font = Font(bold=True, color="FFFFFF")
-                    else:
-                        cell.fill = subtotal_fill
+        # Each row is categorized once, then styled as it is appended
+        for kind, row in [('header', list(_COLUMNS))] + [(_row_kind(row[0]), row) for row in rows]:
+            if kind is not None:
+                font, fill = _ROW_STYLES[kind]
+                styled = _styled_columns(kind)
+                row = [self._styled_cell(worksheet, value, font, fill)
+                       for value in row[:styled]] + row[styled:]
+            worksheet.append(row)
+    
+    def save_with_pyexcelerate(self, rows: List[List[Any]], filepath: Path):
+        """
+        Save the header and rows with pyexcelerate, applying the same formatting.
         
-        # Issues section formatting
-        for row_num in range(2, num_rows + 2):
-            cell_value = worksheet[f'A{row_num}'].value
-            if cell_value and 'ISSUES FOUND' in str(cell_value):
-                worksheet[f'A{row_num}'].font = Font(bold=True, color="C5504B")
+        Args:
+            rows: Row values in column order, without the header
+            filepath: Destination .xlsx path
+        """
+        styles = _pyexcelerate_styles()
+        workbook = pyexcelerate.Workbook()
+        worksheet = workbook.new_sheet('Marking Sheet', data=[list(_COLUMNS)] + rows)
         
-        # Auto-adjust column widths
-        for column in worksheet.columns:
-            max_length = 0
-            column_letter = column[0].column_letter
-            for cell in column:
-                try:
-                    if len(str(cell.value)) > max_length:
-                        max_length = len(str(cell.value))
-                except:
-                    pass
-            adjusted_width = min(max_length + 2, 50)
-            worksheet.column_dimensions[column_letter].width = adjusted_width
+        for column, width in enumerate(_column_widths(rows), start=1):
+            worksheet.set_col_style(column, pyexcelerate.Style(size=width))
+        
+        # pyexcelerate rows and columns are 1-based; row 1 is the header
+        kinds = ['header'] + [_row_kind(row[0]) for row in rows]
+        for row_num, kind in enumerate(kinds, start=1):
+            if kind is not None:
+                for column in range(1, _styled_columns(kind) + 1):
+                    worksheet.set_cell_style(row_num, column, styles[kind])
+        
+        workbook.save(str(filepath))
+    
+    @staticmethod
+    def _styled_cell(worksheet, value: Any, font: Font, fill: PatternFill = None) -> WriteOnlyCell:
+        """Create a write-only cell carrying the given font and optional fill."""
+        cell = WriteOnlyCell(worksheet, value=value)
+        cell.font = font
+        if fill is not None:
+            cell.fill = fill
+        return cell
     
     def generate_all_excel_fixtures(self):
         """Generate all Excel mock fixtures."""
@@ -252,8 +342,8 @@ class ExcelMockGenerator:
         
         # Empty notebook (all zeros)
         empty_data = []
-        for row in self.create_perfect_student_excel_data():
-            new_row = row.copy()
+        for row in _PERFECT_ROWS:
+            new_row = dict(row)
             if row["Task Name"] not in ["TOTAL"] and "Subtotal" not in row["Task Name"]:
                 new_row["Score"] = "0 (MISSING_TASK)"
             else:
@@ -0,0 +1,53 @@
+"""
+Content-hash caching for generated fixture files.
+
+Each generated file gets a sidecar ``.hash`` file holding a SHA-256 digest of
+the generator source and the data it was built from. When the digest is
+unchanged the file is left as is, so repeated fixture runs skip serialization
+and disk writes.
+"""
+
+import functools
+import hashlib
+from pathlib import Path
+from typing import Any
+
+
+@functools.lru_cache(maxsize=None)
+def _source_digest(source_file: str) -> bytes:
+    """Digest of a generator module's source, read once per process."""
+    return hashlib.sha256(Path(source_file).read_bytes()).digest()
+
+
+def fixture_digest(source_file: str, *parts: Any) -> bytes:
+    """
+    Compute the cache key for one fixture file.
+    
+    Args:
+        source_file: Path of the generator module, so code changes invalidate
+        *parts: Data the fixture is built from; hashed via repr()
+        
+    Returns:
+        SHA-256 digest bytes
+    """
+    digest = hashlib.sha256(_source_digest(source_file))
+    digest.update(repr(parts).encode('utf-8'))
+    return digest.digest()
+
+
+def _hash_path(filepath: Path) -> Path:
+    """Sidecar file holding the digest for filepath."""
+    return filepath.with_suffix('.hash')
+
+
+def is_current(filepath: Path, digest: bytes) -> bool:
+    """Whether filepath exists and was last written from the given digest."""
+    try:
+        return filepath.exists() and _hash_path(filepath).read_bytes() == digest
+    except FileNotFoundError:
+        return False
+
+
+def record_digest(filepath: Path, digest: bytes):
+    """Store the digest for a freshly written filepath."""
+    _hash_path(filepath).write_bytes(digest)
@@ -0,0 +1,44 @@
+"""
+JSON encoding shared by conftest and the fixture generators.
+
+orjson is used when installed; otherwise the stdlib json module is used
+with the same layout, so generated files do not depend on which is present.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps(data: Any, indent: bool = True) -> bytes:
+    """
+    Encode data as UTF-8 JSON.
+
+    Non-string keys, such as integer task numbers, are written as strings.
+
+    Args:
+        data: JSON-serializable data
+        indent: Whether to indent nested values by two spaces
+
+    Returns:
+        Encoded JSON bytes
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+    if indent:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def loads(data: bytes) -> Any:
+    """Decode UTF-8 JSON bytes, using orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -12,10 +12,11 @@ This module creates realistic Jupyter notebook fixtures with:
 All notebooks match the expected format from the project brief.
 """
 
-import json
 from pathlib import Path
 from typing import Dict, List, Any
 from .code_templates import CodeTemplateProvider
+from .fixture_cache import fixture_digest, is_current, record_digest
+from .json_encoding import dumps
 
 
 class NotebookFixtureGenerator:
@@ -69,6 +70,27 @@ class NotebookFixtureGenerator:
             "source": [code]
         }
     
+    def _task_cells(self, task_num: int, code: str, header: str = None,
+                    marker: str = None, executed: bool = True) -> List[Dict[str, Any]]:
+        """
+        Create the header, solution marker and code cells for one task.
+        
+        Args:
+            task_num: Task number used in the default header
+            code: Solution code for the code cell
+            header: Header markdown, defaults to "## Task N"
+            marker: Solution marker, defaults to PRIMARY_MARKER
+            executed: Whether the code cell has an execution count
+            
+        Returns:
+            The three cells in notebook order
+        """
+        return [
+            self.create_markdown_cell(header or f"## Task {task_num}\\n"),
+            self.create_markdown_cell(f"{marker or self.PRIMARY_MARKER}\\n"),
+            self.create_code_cell(code, executed=executed),
+        ]
+    
     def create_perfect_student_notebook(self) -> Dict[str, Any]:
         """Create notebook for perfect student with all tasks complete."""
         notebook = self.create_basic_notebook_structure()
@@ -83,21 +105,12 @@ class NotebookFixtureGenerator:
         
         # Add each task
         for task_num in self.TASK_NUMBERS:
-            # Task header
-            header_cell = self.create_markdown_cell(
-                f"## Task {task_num}\\n\\n"
-                f"Below is my solution for Task {task_num}.\\n"
-            )
-            notebook["cells"].append(header_cell)
-            
-            # Solution marker
-            marker_cell = self.create_markdown_cell(f"{self.PRIMARY_MARKER}\\n")
-            notebook["cells"].append(marker_cell)
-            
-            # Solution code
-            code = self.code_provider.get_perfect_code(task_num)
-            code_cell = self.create_code_cell(code)
-            notebook["cells"].append(code_cell)
+            notebook["cells"].extend(self._task_cells(
+                task_num,
+                self.code_provider.get_perfect_code(task_num),
+                header=(f"## Task {task_num}\\n\\n"
+                        f"Below is my solution for Task {task_num}.\\n")
+            ))
             
         return notebook
     
@@ -125,15 +138,9 @@ class NotebookFixtureGenerator:
                 continue
             
             # Complete task
-            header_cell = self.create_markdown_cell(f"## Task {task_num}\\n")
-            notebook["cells"].append(header_cell)
-            
-            marker_cell = self.create_markdown_cell(f"{self.PRIMARY_MARKER}\\n")
-            notebook["cells"].append(marker_cell)
-            
-            code = self.code_provider.get_partial_code(task_num)
-            code_cell = self.create_code_cell(code)
-            notebook["cells"].append(code_cell)
+            notebook["cells"].extend(
+                self._task_cells(task_num, self.code_provider.get_partial_code(task_num))
+            )
             
         return notebook
     
@@ -150,15 +157,9 @@ class NotebookFixtureGenerator:
         
         # Add each task with errors
         for task_num in self.TASK_NUMBERS:
-            header_cell = self.create_markdown_cell(f"## Task {task_num}\\n")
-            notebook["cells"].append(header_cell)
-            
-            marker_cell = self.create_markdown_cell(f"{self.PRIMARY_MARKER}\\n")
-            notebook["cells"].append(marker_cell)
-            
-            code = self.code_provider.get_syntax_error_code(task_num)
-            code_cell = self.create_code_cell(code, executed=False)
-            notebook["cells"].append(code_cell)
+            notebook["cells"].extend(self._task_cells(
+                task_num, self.code_provider.get_syntax_error_code(task_num), executed=False
+            ))
             
         return notebook
     
@@ -197,18 +198,12 @@ class NotebookFixtureGenerator:
         
         # Add each task with special characters
         for task_num in self.TASK_NUMBERS:
-            header_cell = self.create_markdown_cell(
-                f"## Tâche {task_num} — Data Processing ⚡\\n\\n"
-                f"Solution pour la tâche {task_num} avec caractères spéciaux.\\n"
-            )
-            notebook["cells"].append(header_cell)
-            
-            marker_cell = self.create_markdown_cell(f"{self.PRIMARY_MARKER}\\n")
-            notebook["cells"].append(marker_cell)
-            
-            code = self.code_provider.get_special_chars_code(task_num)
-            code_cell = self.create_code_cell(code)
-            notebook["cells"].append(code_cell)
+            notebook["cells"].extend(self._task_cells(
+                task_num,
+                self.code_provider.get_special_chars_code(task_num),
+                header=(f"## Tâche {task_num} — Data Processing ⚡\\n\\n"
+                        f"Solution pour la tâche {task_num} avec caractères spéciaux.\\n")
+            ))
             
         return notebook
     
@@ -225,24 +220,20 @@ class NotebookFixtureGenerator:
         
         # Add tasks with secondary marker
         for task_num in self.TASK_NUMBERS:
-            header_cell = self.create_markdown_cell(f"## Task {task_num}\\n")
-            notebook["cells"].append(header_cell)
-            
-            # Use secondary marker format
-            marker_cell = self.create_markdown_cell(f"{self.SECONDARY_MARKER}\\n")
-            notebook["cells"].append(marker_cell)
-            
-            code = self.code_provider.get_perfect_code(task_num)
-            code_cell = self.create_code_cell(code)
-            notebook["cells"].append(code_cell)
+            notebook["cells"].extend(self._task_cells(
+                task_num, self.code_provider.get_perfect_code(task_num), marker=self.SECONDARY_MARKER
+            ))
             
         return notebook
     
     def save_notebook(self, notebook: Dict[str, Any], filename: str):
-        """Save notebook to file."""
+        """Save notebook to file, unless it is unchanged since the last run."""
         filepath = self.notebooks_dir / f"{filename}.ipynb"
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(notebook, f, indent=2, ensure_ascii=False)
+        digest = fixture_digest(__file__, notebook)
+        if is_current(filepath, digest):
+            return
+        filepath.write_bytes(dumps(notebook))
+        record_digest(filepath, digest)
     
     def create_corrupted_notebook_file(self, filename: str):
         """Create corrupted JSON file."""
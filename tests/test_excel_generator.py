@@ -29,6 +29,14 @@ class TestExcelFormatter:
         assert style['border'] == 1
         assert style['align'] == 'center'
     
+    def test_styles_are_shared_read_only_constants(self):
+        """Test that style getters return the same immutable mapping each call."""
+        style = ExcelFormatter.get_header_style()
+        
+        assert ExcelFormatter.get_header_style() is style
+        with pytest.raises(TypeError):
+            style['bold'] = False
+    
     def test_get_task_header_style(self):
         """Test task header style properties."""
         style = ExcelFormatter.get_task_header_style()
@@ -68,6 +76,17 @@ class TestExcelFormatter:
         formatted = ExcelFormatter.format_error_flag('PARSING_ERROR')
         assert formatted == "0 (PARSING_ERROR)"
     
+    def test_create_format_reuses_formats_per_workbook(self, tmp_path):
+        """Test that identical styles share one format object per workbook."""
+        style = ExcelFormatter.get_header_style()
+        
+        with xlsxwriter.Workbook(str(tmp_path / "first.xlsx")) as first_workbook, \
+                xlsxwriter.Workbook(str(tmp_path / "second.xlsx")) as second_workbook:
+            first_format = ExcelFormatter.create_format(first_workbook, style)
+            
+            assert ExcelFormatter.create_format(first_workbook, dict(style)) is first_format
+            assert ExcelFormatter.create_format(second_workbook, style) is not first_format
+    
     def test_get_error_types(self):
         """Test error types dictionary."""
         error_types = ExcelFormatter.get_error_types()
@@ -142,6 +161,16 @@ class TestExcelGenerator:
         assert output_dir.is_dir()
         assert generator.output_dir == output_dir
     
+    def test_init_recreates_deleted_output_directory(self, temp_dir):
+        """Test that a new generator recreates an output directory removed after an earlier one."""
+        output_dir = temp_dir / "marks_output"
+        ExcelGenerator(output_dir)
+        shutil.rmtree(output_dir)
+        
+        ExcelGenerator(output_dir)
+        
+        assert output_dir.is_dir()
+    
     def test_init_with_invalid_directory_raises_error(self):
         """Test initialization with invalid directory raises error."""
         # Try to create directory in a read-only location (if possible)
@@ -287,6 +316,46 @@ class TestExcelGenerator:
         assert output_file.exists()
         assert output_file.name == "batch_summary.xlsx"
     
+    def test_generate_marking_sheets_batch(
+        self, 
+        excel_generator, 
+        sample_rubric_data, 
+        sample_marking_results
+    ):
+        """Test generating marking sheets in parallel worker processes."""
+        jobs = [
+            ("BATCH001", sample_rubric_data, sample_marking_results, None),
+            ("BATCH002", sample_rubric_data, {}, ["Task 2: MISSING_TASK"]),
+        ]
+        
+        paths = excel_generator.generate_marking_sheets_batch(jobs, workers=2)
+        
+        assert paths == [
+            excel_generator.get_output_path("BATCH001"),
+            excel_generator.get_output_path("BATCH002"),
+        ]
+        assert all(path.exists() for path in paths)
+    
+    def test_generate_marking_sheets_multi(
+        self, 
+        excel_generator, 
+        sample_rubric_data, 
+        sample_marking_results
+    ):
+        """Test generating several students' sheets in one workbook."""
+        import openpyxl
+        
+        per_student = {
+            "STUDENT002": (sample_rubric_data, sample_marking_results, None),
+            "STUDENT001": (sample_rubric_data, {}, ["Task 2: MISSING_TASK"]),
+        }
+        
+        output_file = excel_generator.generate_marking_sheets_multi(per_student)
+        
+        assert output_file.exists()
+        assert output_file.name == "marking_sheets.xlsx"
+        assert openpyxl.load_workbook(output_file).sheetnames == ["STUDENT001", "STUDENT002"]
+    
     def test_create_formats_returns_all_needed_formats(self, excel_generator):
         """Test that _create_formats returns all required format objects."""
         # Create a mock workbook
@@ -347,6 +416,87 @@ class TestExcelGenerator:
         # Could add more detailed structure verification here
         # by reading the Excel file back with pandas or openpyxl
     
+    def test_marking_sheet_cell_contents(
+        self, 
+        excel_generator, 
+        sample_rubric_data, 
+        sample_marking_results
+    ):
+        """Test the written cell values by reading the workbook back."""
+        import openpyxl
+        
+        output_file = excel_generator.generate_marking_sheet(
+            student_id="CONTENTS_TEST",
+            rubric_data=sample_rubric_data,
+            marking_results=sample_marking_results,
+            issues=["Task 2 Criterion 3: PARSING_ERROR"]
+        )
+        
+        worksheet = openpyxl.load_workbook(output_file, data_only=True).active
+        rows = [list(row) for row in worksheet.iter_rows(values_only=True)]
+        
+        assert rows[0] == ['Task Name', 'Criterion Description', 'Student Score', 'Max Points']
+        assert rows[1] == ['Task 2', 'Joins list elements from payload', 2, 2]
+        assert rows[3] == [None, 'Correctly displays output', '0 (PARSING_ERROR)', 2]
+        assert rows[4][1:] == ['SUBTOTAL', 3, 6]
+        assert rows[9][1:] == ['SUBTOTAL', 6, 6]
+        assert rows[11][1:] == ['GRAND TOTAL', 9, 12]
+        assert rows[13][0] == 'ISSUES FOUND:'
+        assert rows[14][:2] == ['•', 'Task 2 Criterion 3: PARSING_ERROR']
+        assert rows[15][:2] == ['•', 'Manual review required for 1 items']
+        
+        formulas = openpyxl.load_workbook(output_file).active
+        assert formulas['C5'].value == '=SUM(C2:C4)'
+        assert formulas['D12'].value == '=SUMIF(B2:B11,"SUBTOTAL",D2:D11)'
+    
+    def test_subtotal_ignores_results_without_criterion_row(
+        self, 
+        excel_generator, 
+        sample_rubric_data
+    ):
+        """Test that cached subtotals only count results shown on the sheet."""
+        import openpyxl
+        
+        output_file = excel_generator.generate_marking_sheet(
+            student_id="ORPHAN_TEST",
+            rubric_data=sample_rubric_data,
+            marking_results={2: [
+                {'score': 2, 'criterion_index': 0},
+                {'score': 1, 'criterion_index': 1},
+                {'score': 2, 'criterion_index': 2},
+                {'score': 5, 'criterion_index': 7},
+            ]}
+        )
+        
+        worksheet = openpyxl.load_workbook(output_file, data_only=True).active
+        rows = [list(row) for row in worksheet.iter_rows(values_only=True)]
+        
+        assert rows[4][1:] == ['SUBTOTAL', 5, 6]
+        assert next(row for row in rows if row[1] == 'GRAND TOTAL')[2] == 5
+    
+    def test_marking_sheet_reports_structural_issues(
+        self, 
+        excel_generator, 
+        sample_rubric_data
+    ):
+        """Test that rubric/result mismatches are written to the issues section."""
+        import openpyxl
+        
+        output_file = excel_generator.generate_marking_sheet(
+            student_id="STRUCTURAL_TEST",
+            rubric_data=sample_rubric_data,
+            marking_results={2: [{'score': 1, 'criterion_index': 0}], 9: [{'score': 1}]}
+        )
+        
+        worksheet = openpyxl.load_workbook(output_file).active
+        issue_texts = [row[1] for row in worksheet.iter_rows(values_only=True) if row[0] == '•']
+        
+        assert issue_texts == [
+            "Task 2: Expected 3 results, got 1",
+            "No results found for Task 3",
+            "Results found for unknown Task 9",
+        ]
+    
     def test_subtotal_calculation_excludes_error_scores(
         self, 
         excel_generator, 
@@ -114,6 +114,26 @@ student_mark_out_of_10 = "Numeric grade"
         # Should be sorted
         assert models == sorted(models)
     
+    def test_list_available_models_cache_invalidation(self, temp_dirs):
+        """Test that the model listing is refreshed when the directory changes."""
+        import os
+        
+        loader = ModelLoader(
+            programs_dir=temp_dirs['programs_dir'],
+            marking_config_file=temp_dirs['toml_file']
+        )
+        
+        assert len(loader.list_available_models()) == 3
+        
+        programs_dir = Path(temp_dirs['programs_dir'])
+        (programs_dir / "new_model").touch()
+        stat = os.stat(programs_dir)
+        os.utime(programs_dir, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        
+        models = loader.list_available_models()
+        assert len(models) == 4
+        assert "new_model" in models
+    
     def test_get_best_model_for_marker(self, temp_dirs):
         """Test getting best model for a marker."""
         loader = ModelLoader(
@@ -133,6 +153,79 @@ student_mark_out_of_10 = "Numeric grade"
         best_model = loader.get_best_model_for_marker("nonexistent")
         assert best_model is None
     
+    def test_get_best_model_for_marker_logs_every_call(self, temp_dirs, caplog):
+        """Test that the selection is logged even when it comes from the cache."""
+        loader = ModelLoader(
+            programs_dir=temp_dirs['programs_dir'],
+            marking_config_file=temp_dirs['toml_file']
+        )
+        
+        with caplog.at_level("INFO", logger="src.marking.model_loader"):
+            loader.get_best_model_for_marker("question_subquestion_v2")
+            loader.get_best_model_for_marker("question_subquestion_v2")
+            loader.get_best_model_for_marker("nonexistent")
+            loader.get_best_model_for_marker("nonexistent")
+        
+        messages = [record.getMessage() for record in caplog.records]
+        assert messages.count("Selected fallback model for question_subquestion_v2: "
+                              "question_subquestion_v2_model") == 2
+        assert messages.count("No pre-trained models found for marker: nonexistent") == 2
+    
+    def test_load_pretrained_model(self, temp_dirs):
+        """Test loading and caching a pickled model."""
+        model_path = Path(temp_dirs['programs_dir']) / "pickled_model"
+        model_path.write_bytes(pickle.dumps({'weights': [1, 2, 3]}))
+        
+        loader = ModelLoader(
+            programs_dir=temp_dirs['programs_dir'],
+            marking_config_file=temp_dirs['toml_file']
+        )
+        
+        model = loader.load_pretrained_model("pickled_model")
+        assert model == {'weights': [1, 2, 3]}
+        
+        # Second load should come from the cache
+        assert loader.load_pretrained_model("pickled_model") is model
+    
+    def test_load_pretrained_model_memory_mapped(self, temp_dirs):
+        """Test that large model files are loaded through mmap."""
+        model_path = Path(temp_dirs['programs_dir']) / "large_model"
+        model_path.write_bytes(pickle.dumps(list(range(100))))
+        
+        loader = ModelLoader(
+            programs_dir=temp_dirs['programs_dir'],
+            marking_config_file=temp_dirs['toml_file']
+        )
+        
+        with patch('src.marking.model_loader.MMAP_THRESHOLD_BYTES', 0):
+            model = loader.load_pretrained_model("large_model")
+        
+        assert model == list(range(100))
+    
+    def test_load_pretrained_model_does_not_write_files(self, temp_dirs):
+        """Test that loading a model leaves the programs directory untouched."""
+        programs_dir = Path(temp_dirs['programs_dir'])
+        (programs_dir / "pickled_model").write_bytes(pickle.dumps({'weights': [1, 2, 3]}))
+        before = sorted(path.name for path in programs_dir.iterdir())
+        
+        loader = ModelLoader(
+            programs_dir=temp_dirs['programs_dir'],
+            marking_config_file=temp_dirs['toml_file']
+        )
+        loader.load_pretrained_model("pickled_model")
+        
+        assert sorted(path.name for path in programs_dir.iterdir()) == before
+    
+    def test_load_pretrained_model_missing_file(self, temp_dirs):
+        """Test loading a model that does not exist."""
+        loader = ModelLoader(
+            programs_dir=temp_dirs['programs_dir'],
+            marking_config_file=temp_dirs['toml_file']
+        )
+        
+        with pytest.raises(FileNotFoundError, match="Model file not found"):
+            loader.load_pretrained_model("missing_model")
+    
     @patch('src.marking.model_loader.create_dynamic_signature_class')
     @patch('src.marking.model_loader.create_dynamic_signature_instance')
     def test_create_marker_with_dynamic_scale(self, mock_instance, mock_class, temp_dirs):
@@ -11,7 +11,7 @@ import tempfile
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
-from src.parsers.notebook_parser import NotebookParser, NotebookParsingError
+from src.parsers.notebook_parser import NotebookParser, NotebookParsingError, parse_many
 
 
 class TestNotebookParser:
@@ -125,6 +125,12 @@ class TestNotebookParser:
         code = parser._extract_code_from_cell(code_cell)
         assert code == 'def test():\n    return True'
         
+        # Test single-fragment and empty list sources
+        code = parser._extract_code_from_cell({'cell_type': 'code', 'source': ['  x = 1\n']})
+        assert code == 'x = 1'
+        code = parser._extract_code_from_cell({'cell_type': 'code', 'source': []})
+        assert code == ""
+        
         # Test markdown cell (should return empty)
         markdown_cell = {
             'cell_type': 'markdown',
@@ -176,6 +182,15 @@ class TestNotebookParser:
         valid, issue = parser._validate_code_content("pass")
         assert valid is False
         assert issue == "PLACEHOLDER_CODE"
+        
+        # Placeholders only count in snippets of at most two lines
+        valid, issue = parser._validate_code_content("x = 1\n\npass")
+        assert valid is False
+        assert issue == "PLACEHOLDER_CODE"
+        
+        valid, issue = parser._validate_code_content("x = 1\ny = 2\npass")
+        assert valid is True
+        assert issue is None
     
     def test_get_task_code(self, complete_notebook_path):
         """Test getting code for specific tasks."""
@@ -199,6 +214,48 @@ class TestNotebookParser:
         for task_num in range(2, 8):
             assert task_num in all_tasks
     
+    def test_getters_parse_only_once(self, missing_tasks_notebook_path):
+        """Test that repeated getter calls reuse the first parse."""
+        parser = NotebookParser(missing_tasks_notebook_path)
+        
+        with patch.object(
+            NotebookParser, 'parse_tasks', autospec=True, side_effect=NotebookParser.parse_tasks
+        ) as mock_parse:
+            parser.get_task_code(2)
+            parser.has_all_tasks()
+            parser.get_summary()
+            all_tasks = parser.get_all_tasks()
+        
+        assert mock_parse.call_count == 1
+        with pytest.raises(TypeError):
+            all_tasks[2] = "modified"
+    
+    def test_iter_tasks(self, complete_notebook_path):
+        """Test that tasks are yielded as found and stored once exhausted."""
+        parser = NotebookParser(complete_notebook_path)
+        
+        task_iter = parser.iter_tasks()
+        first_number, first_code = next(task_iter)
+        assert first_number == 2
+        assert 'fibonacci' in first_code
+        assert not parser._parsed
+        
+        remaining = list(task_iter)
+        assert [number for number, _ in remaining] == [3]
+        assert parser._parsed
+        assert parser.get_task_code(2) == first_code
+        
+        # Once parsed, found tasks are replayed without rescanning
+        assert list(parser.iter_tasks()) == [(2, first_code)] + remaining
+    
+    def test_parser_has_no_instance_dict(self, complete_notebook_path):
+        """Test that parser instances only hold their declared slots."""
+        parser = NotebookParser(complete_notebook_path)
+        
+        assert not hasattr(parser, '__dict__')
+        with pytest.raises(AttributeError):
+            parser.unexpected_attribute = True
+    
     def test_get_issues(self, missing_tasks_notebook_path):
         """Test getting parsing issues."""
         parser = NotebookParser(missing_tasks_notebook_path)
@@ -314,6 +371,92 @@ class TestNotebookParser:
         finally:
             Path(f.name).unlink()
     
+    def test_code_cell_beyond_look_ahead_window(self):
+        """Test that markers only pair with a code cell within the next 2 cells."""
+        notebook_data = {
+            "cells": [
+                {"cell_type": "markdown", "metadata": {}, "source": ["#### Your Solution"]},
+                {"cell_type": "markdown", "metadata": {}, "source": ["#### Your Solution"]},
+                {"cell_type": "code", "metadata": {}, "source": ["def bot_whisper(payload):\n    return payload.lower()"]},
+                {"cell_type": "markdown", "metadata": {}, "source": ["#### Your Solution"]},
+                {"cell_type": "markdown", "metadata": {}, "source": ["Some explanation"]},
+                {"cell_type": "markdown", "metadata": {}, "source": ["More explanation"]},
+                {"cell_type": "code", "metadata": {}, "source": ["def bot_multiply(a, b):\n    return a * b"]}
+            ],
+            "metadata": {},
+            "nbformat": 4,
+            "nbformat_minor": 4
+        }
+        
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.ipynb', delete=False) as f:
+            json.dump(notebook_data, f)
+        
+        try:
+            parser = NotebookParser(f.name)
+            tasks = parser.parse_tasks()
+            
+            # Back-to-back markers both pair with the following code cell
+            assert 'bot_whisper' in tasks[2]
+            assert 'bot_whisper' in tasks[3]
+            assert not any('bot_multiply' in code for code in tasks.values())
+            assert "No code cell found after solution marker in cell 3" in parser.get_issues()
+        finally:
+            Path(f.name).unlink()
+    
+    def test_streaming_load_matches_full_load(self, complete_notebook_path):
+        """Test that stream-parsing keeps only cell types and sources."""
+        pytest.importorskip("ijson")
+        
+        full_parser = NotebookParser(complete_notebook_path)
+        
+        with patch.object(NotebookParser, 'STREAMING_THRESHOLD_BYTES', 0):
+            streaming_parser = NotebookParser(complete_notebook_path)
+        
+        assert set(streaming_parser.notebook_data) == {'cells'}
+        assert all(
+            set(cell) == {'cell_type', 'source'}
+            for cell in streaming_parser.notebook_data['cells']
+        )
+        assert streaming_parser.parse_tasks() == full_parser.parse_tasks()
+    
+    def test_typed_load_matches_full_load(self, complete_notebook_path):
+        """Test that msgspec-decoded cells parse the same as plain dicts."""
+        pytest.importorskip("msgspec")
+        
+        typed_parser = NotebookParser(complete_notebook_path)
+        
+        with patch('src.parsers.notebook_parser.msgspec', None):
+            full_parser = NotebookParser(complete_notebook_path)
+        
+        assert not isinstance(typed_parser.notebook_data['cells'][0], dict)
+        assert isinstance(full_parser.notebook_data['cells'][0], dict)
+        assert typed_parser.parse_tasks() == full_parser.parse_tasks()
+        assert typed_parser.get_issues() == full_parser.get_issues()
+        
+    def test_memory_mapped_load_matches_full_load(self, complete_notebook_path):
+        """Test that decoding from a memory map gives the same tasks."""
+        full_parser = NotebookParser(complete_notebook_path)
+        
+        with patch.object(NotebookParser, 'MMAP_THRESHOLD_BYTES', 0):
+            mapped_parser = NotebookParser(complete_notebook_path)
+            with patch('src.parsers.notebook_parser.msgspec', None):
+                mapped_dict_parser = NotebookParser(complete_notebook_path)
+        
+        assert mapped_parser.parse_tasks() == full_parser.parse_tasks()
+        assert mapped_dict_parser.parse_tasks() == full_parser.parse_tasks()
+    
+    def test_parse_many(self, complete_notebook_path, missing_tasks_notebook_path):
+        """Test parsing several notebooks in parallel worker processes."""
+        paths = [str(complete_notebook_path), str(missing_tasks_notebook_path)]
+        
+        results = parse_many(paths, workers=2)
+        
+        assert list(results) == paths
+        for path in paths:
+            parser = NotebookParser(path)
+            assert results[path] == (parser.parse_tasks(), parser.get_issues())
+        assert parse_many([]) == {}
+    
     @patch('src.parsers.notebook_parser.logger')
     def test_logging_behavior(self, mock_logger, complete_notebook_path):
         """Test that appropriate logging occurs during parsing."""
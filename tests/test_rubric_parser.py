@@ -9,10 +9,11 @@ import pytest
 import pandas as pd
 import tempfile
 import csv
+import pickle
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
-from src.parsers.rubric_parser import RubricParser, RubricParsingError
+from src.parsers.rubric_parser import Criterion, RubricParser, RubricParsingError
 
 
 class TestRubricParser:
@@ -72,6 +73,21 @@ class TestRubricParser:
         finally:
             Path(f.name).unlink()
     
+    def test_load_falls_back_without_pyarrow(self, valid_rubric_path):
+        """Test that the default CSV engine is used when pyarrow is unavailable."""
+        real_read_csv = pd.read_csv
+        
+        def read_csv(*args, **kwargs):
+            if kwargs.get('engine') == 'pyarrow':
+                raise ImportError("pyarrow is not installed")
+            return real_read_csv(*args, **kwargs)
+        
+        with patch('src.parsers.rubric_parser.pd.read_csv', side_effect=read_csv) as mock_read_csv:
+            parser = RubricParser(valid_rubric_path)
+        
+        assert mock_read_csv.call_count == 2
+        assert parser.get_total_max_points() == 83
+    
     def test_parse_valid_rubric(self, valid_rubric_path):
         """Test parsing a valid rubric file."""
         parser = RubricParser(valid_rubric_path)
@@ -131,6 +147,7 @@ class TestRubricParser:
         assert parser._parse_max_points("abc") is None
         assert parser._parse_max_points(None) is None
         assert parser._parse_max_points("  ") is None
+        assert parser._parse_max_points("inf") is None
     
     def test_is_subtotal_row(self, valid_rubric_path):
         """Test subtotal row detection."""
@@ -205,6 +222,27 @@ class TestRubricParser:
         task_999_criteria = parser.get_task_criteria(999)
         assert task_999_criteria is None
     
+    def test_criteria_are_frozen_records(self, valid_rubric_path):
+        """Test that criteria are immutable records with dict-style access."""
+        parser = RubricParser(valid_rubric_path)
+        criterion = parser.get_criterion_by_index(2, 0)
+        
+        assert isinstance(criterion, Criterion)
+        assert not hasattr(criterion, '__dict__')
+        assert criterion['max_points'] == criterion.max_points
+        assert criterion.to_dict() == {
+            'task_number': 2,
+            'criterion': criterion.criterion,
+            'max_points': criterion.max_points,
+            'row_index': criterion.row_index
+        }
+        assert pickle.loads(pickle.dumps(criterion)) == criterion
+        
+        with pytest.raises(AttributeError):
+            criterion.max_points = 99
+        with pytest.raises(KeyError):
+            criterion['score']
+    
     def test_get_all_tasks(self, valid_rubric_path):
         """Test getting all tasks."""
         parser = RubricParser(valid_rubric_path)
@@ -214,6 +252,11 @@ class TestRubricParser:
         for task_num in range(2, 8):
             assert task_num in all_tasks
             assert len(all_tasks[task_num]) > 0
+        
+        # A shared read-only view rather than a fresh copy per call
+        assert parser.get_all_tasks() is all_tasks
+        with pytest.raises(TypeError):
+            all_tasks[2] = []
     
     def test_get_task_max_points(self, valid_rubric_path):
         """Test getting maximum points for tasks."""
@@ -234,6 +277,18 @@ class TestRubricParser:
         total = parser.get_total_max_points()
         assert total == 83  # Expected total
     
+    def test_parse_rubric_is_cached(self, invalid_rubric_path):
+        """Test that repeated parses reuse the first result and issues."""
+        parser = RubricParser(invalid_rubric_path)
+        tasks = parser.parse_rubric()
+        issues = parser.get_issues()
+        
+        assert parser.parse_rubric() is tasks
+        assert parser.get_issues() == issues
+        assert parser.get_total_max_points() == sum(
+            parser.get_task_max_points(task_num) for task_num in tasks
+        )
+    
     def test_get_issues(self, invalid_rubric_path):
         """Test getting parsing issues."""
         parser = RubricParser(invalid_rubric_path)
@@ -253,6 +308,21 @@ class TestRubricParser:
         invalid_parser = RubricParser(invalid_rubric_path)
         assert invalid_parser.is_valid() is False
     
+    def test_is_valid_tracks_critical_issues(self, valid_rubric_path):
+        """Test that validation flags critical issues for is_valid."""
+        parser = RubricParser(valid_rubric_path)
+        assert parser.is_valid() is True
+        
+        # Per-task point mismatches that keep the total are not critical
+        parser._validate_task_structure(
+            {**parser.tasks, 2: [{'max_points': 9}], 3: [{'max_points': 9}]}
+        )
+        assert any("Task 2: Expected 8 points, found 9" in issue for issue in parser.issues)
+        assert parser.is_valid() is True
+        
+        parser._validate_task_structure({2: parser.tasks[2]})
+        assert parser.is_valid() is False
+    
     def test_get_criterion_by_index(self, valid_rubric_path):
         """Test getting specific criterion by index."""
         parser = RubricParser(valid_rubric_path)
@@ -412,6 +482,28 @@ class TestRegressionCases:
         finally:
             Path(f.name).unlink()
     
+    def test_row_index_recorded(self):
+        """Test that criteria keep the CSV row they were read from."""
+        rubric_data = [
+            ["Task 2", "First criterion", "", "2"],
+            ["", "", "", ""],
+            ["", "SUBTOTAL", "0", "2"],
+            ["Task 3", "Second criterion", "", "3"]
+        ]
+        
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
+            writer = csv.writer(f)
+            writer.writerows(rubric_data)
+        
+        try:
+            parser = RubricParser(f.name)
+            tasks = parser.parse_rubric()
+            
+            assert [c['row_index'] for c in tasks[2]] == [0]
+            assert [c['row_index'] for c in tasks[3]] == [3]
+        finally:
+            Path(f.name).unlink()
+    
     def test_mixed_case_task_names(self):
         """Test handling of mixed case in task names."""
         rubric_data = [